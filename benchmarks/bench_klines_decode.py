@@ -0,0 +1,72 @@
+"""
+Klines decode micro-benchmark
+Compares decode_klines with the per-candle float() loop, json + from_klines
+and, when installed, orjson + from_klines
+
+Run from the repository root:
+    python benchmarks/bench_klines_decode.py [candles] [repeats]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from signal_engine.candles import CandleSeries  # noqa: E402
+from signal_engine.klines_decode import decode_klines, json_backend  # noqa: E402
+
+
+def make_payload(count):
+    """Klines response body shaped like Binance's"""
+    start = 1_700_000_000_000
+    rows = []
+    for i in range(count):
+        open_time = start + i * 60_000
+        rows.append([
+            open_time, f"{50000 + i * 0.01:.8f}", f"{50010 + i * 0.01:.8f}",
+            f"{49990 + i * 0.01:.8f}", f"{50005 + i * 0.01:.8f}", f"{12.5 + i % 7:.8f}",
+            open_time + 59_999, "617283.12345678", 1234, "6.17283500", "308641.56172839", "0"
+        ])
+    return json.dumps(rows, separators=(',', ':')).encode()
+
+
+def decode_loop(raw):
+    """The list-of-dicts parse fetch_data used originally"""
+    prices = []
+    for candle in json.loads(raw):
+        prices.append({
+            'timestamp': candle[0],
+            'open': float(candle[1]),
+            'high': float(candle[2]),
+            'low': float(candle[3]),
+            'close': float(candle[4]),
+            'volume': float(candle[5])
+        })
+    return prices
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    raw = make_payload(count)
+
+    baseline = min(timeit.repeat(lambda: decode_loop(raw), number=repeats, repeat=5)) / repeats
+    from_json = min(timeit.repeat(lambda: CandleSeries.from_klines(json.loads(raw)), number=repeats, repeat=5)) / repeats
+    fast = min(timeit.repeat(lambda: decode_klines(raw), number=repeats, repeat=5)) / repeats
+    from_orjson = None
+    if json_backend() is not json:
+        loads = json_backend().loads
+        from_orjson = min(timeit.repeat(lambda: CandleSeries.from_klines(loads(raw)), number=repeats, repeat=5)) / repeats
+
+    print(f"{count} candles, {len(raw) / 1024:.1f} KiB, JSON backend {json_backend().__name__}")
+    print(f"  list-of-dicts loop : {baseline * 1e3:8.3f} ms")
+    print(f"  json + from_klines : {from_json * 1e3:8.3f} ms  ({baseline / from_json:.1f}x)")
+    if from_orjson is not None:
+        print(f"  orjson + from_klines: {from_orjson * 1e3:7.3f} ms  ({baseline / from_orjson:.1f}x)")
+    print(f"  decode_klines      : {fast * 1e3:8.3f} ms  ({baseline / fast:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
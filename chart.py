@@ -0,0 +1,185 @@
+"""
+Candle chart
+Candlesticks and SMA overlays drawn with a handful of Kivy Mesh instructions
+"""
+
+from kivy.graphics import (
+    Color, Mesh, PopMatrix, PushMatrix, Rectangle, Scale, ScissorPop, ScissorPush, Translate
+)
+from kivy.uix.widget import Widget
+import numpy as np
+
+from signal_engine.indicators import sma
+
+
+# Mesh indices are unsigned shorts: 8 vertices per candle keeps a mesh under 65536
+MAX_CANDLES = 8000
+BODY_WIDTH = 0.7
+WICK_WIDTH = 0.12
+
+
+def candle_quads(left, right, bottom, top):
+    """Vertices (x, y, u, v) and triangle indices for one quad per row"""
+    count = len(left)
+    vertices = np.zeros((count, 4, 4), dtype=np.float32)
+    vertices[:, 0, 0] = vertices[:, 3, 0] = left
+    vertices[:, 1, 0] = vertices[:, 2, 0] = right
+    vertices[:, 0, 1] = vertices[:, 1, 1] = bottom
+    vertices[:, 2, 1] = vertices[:, 3, 1] = top
+    base = np.arange(count, dtype=np.uint32)[:, None] * 4
+    indices = (base + np.array([0, 1, 2, 2, 3, 0], dtype=np.uint32)).ravel()
+    return vertices.reshape(-1, 4), indices
+
+
+class CandleChart(Widget):
+    """Pan/zoom candlestick chart with SMA 20/50 lines
+
+    Geometry is built once per candle update in data space (x = candle index,
+    y = price above the series low). Panning and zooming only change the
+    Translate/Scale instructions in front of the meshes, so the vertex
+    buffers stay untouched between updates.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prices = None
+        self.visible = 100
+        self.offset = 0.0
+        self._base = 0.0
+        self._touches = {}
+
+        with self.canvas:
+            self._scissor = ScissorPush(x=0, y=0, width=1, height=1)
+            Color(0.12, 0.12, 0.12, 1)
+            self._background = Rectangle(pos=self.pos, size=self.size)
+            PushMatrix()
+            self._origin = Translate(0, 0)
+            self._scale = Scale(1, 1, 1)
+            self._view = Translate(0, 0)
+            Color(0.22, 0.93, 0.49, 1)
+            self._up = Mesh(mode='triangles')
+            Color(0.92, 0.36, 0.26, 1)
+            self._down = Mesh(mode='triangles')
+            Color(1, 0.8, 0.2, 1)
+            self._sma_20 = Mesh(mode='line_strip')
+            Color(0.4, 0.49, 0.92, 1)
+            self._sma_50 = Mesh(mode='line_strip')
+            PopMatrix()
+            ScissorPop()
+
+        self.bind(pos=self.update_view, size=self.update_view)
+
+    def set_candles(self, prices):
+        """Replace the series; keeps the view pinned to the newest candle if it was"""
+        prices = prices[-MAX_CANDLES:]
+        following = self.prices is None or self.offset <= 0
+        self.prices = prices
+        if not len(prices):
+            for mesh in (self._up, self._down, self._sma_20, self._sma_50):
+                mesh.indices = []
+                mesh.vertices = []
+            return
+
+        self._base = float(prices.low.min())
+        x = np.arange(len(prices), dtype=np.float64)
+        up = prices.close >= prices.open
+        for mesh, mask in ((self._up, up), (self._down, ~up)):
+            self._fill_candles(mesh, x[mask], mask)
+        for mesh, period in ((self._sma_20, 20), (self._sma_50, 50)):
+            self._fill_line(mesh, x, sma(prices.close, period))
+
+        if following:
+            self.offset = 0.0
+        self.update_view()
+
+    def _fill_candles(self, mesh, x, mask):
+        prices = self.prices
+        open_ = prices.open[mask] - self._base
+        close = prices.close[mask] - self._base
+        body_bottom = np.minimum(open_, close)
+        body_top = np.maximum(open_, close)
+        # Flat candles still get a visible body
+        body_top = np.maximum(body_top, body_bottom + (prices.high.max() - self._base) * 0.002)
+
+        bodies, body_indices = candle_quads(x - BODY_WIDTH / 2, x + BODY_WIDTH / 2, body_bottom, body_top)
+        wicks, wick_indices = candle_quads(
+            x - WICK_WIDTH / 2, x + WICK_WIDTH / 2,
+            prices.low[mask] - self._base, prices.high[mask] - self._base
+        )
+        mesh.vertices = np.concatenate((bodies, wicks)).ravel()
+        mesh.indices = np.concatenate((body_indices, wick_indices + len(bodies))).tolist()
+
+    def _fill_line(self, mesh, x, values):
+        keep = ~np.isnan(values)
+        vertices = np.zeros((int(keep.sum()), 4), dtype=np.float32)
+        vertices[:, 0] = x[keep]
+        vertices[:, 1] = values[keep] - self._base
+        mesh.vertices = vertices.ravel()
+        mesh.indices = list(range(len(vertices)))
+
+    def update_view(self, *args):
+        """Fit the visible window into the widget by moving the transform only"""
+        window_x, window_y = self.to_window(*self.pos)
+        self._scissor.x, self._scissor.y = int(window_x), int(window_y)
+        self._scissor.width, self._scissor.height = int(self.width), int(self.height)
+        self._background.pos = self.pos
+        self._background.size = self.size
+        if self.prices is None or not len(self.prices) or self.width <= 0 or self.height <= 0:
+            return
+
+        count = len(self.prices)
+        self.visible = max(10, min(self.visible, count))
+        self.offset = min(max(self.offset, 0.0), max(0.0, count - self.visible))
+        end = count - int(self.offset)
+        start = max(0, end - self.visible)
+        low = float(self.prices.low[start:end].min()) - self._base
+        high = float(self.prices.high[start:end].max()) - self._base
+        span = (high - low) or 1.0
+        pad = span * 0.05
+
+        self._origin.x, self._origin.y = self.x, self.y
+        self._scale.x = self.width / self.visible
+        self._scale.y = self.height / (span + 2 * pad)
+        self._view.x = -(count - self.offset - self.visible) + 0.5
+        self._view.y = -(low - pad)
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+        if touch.is_mouse_scrolling:
+            self.zoom(0.9 if touch.button == 'scrolldown' else 1.1)
+            return True
+        touch.grab(self)
+        self._touches[touch.uid] = touch
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_move(touch)
+        if len(self._touches) >= 2:
+            first, second = list(self._touches.values())[:2]
+            other = second if touch is first else first
+            before = np.hypot(touch.px - other.x, touch.py - other.y)
+            after = np.hypot(touch.x - other.x, touch.y - other.y)
+            if before > 0 and after > 0:
+                self.zoom(before / after)
+        elif self.width > 0:
+            self.pan(touch.dx * self.visible / self.width)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_up(touch)
+        touch.ungrab(self)
+        self._touches.pop(touch.uid, None)
+        return True
+
+    def pan(self, candles):
+        """Scroll back in time by `candles` (negative moves toward the newest)"""
+        self.offset += candles
+        self.update_view()
+
+    def zoom(self, factor):
+        """Show `factor` times as many candles"""
+        self.visible = int(round(self.visible * factor)) or 1
+        self.update_view()
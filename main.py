@@ -9,156 +9,70 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
+from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.scrollview import ScrollView
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.graphics import Color, RoundedRectangle
-import requests
+import asyncio
 import json
-from datetime import datetime
+import os
 
-# Set window size for testing
-Window.size = (360, 640)
+from chart import CandleChart
+from watchlist import WatchlistScreen
+from signal_engine import (
+    AsyncTradingSignal,
+    CandleStore,
+    CoalescingExecutor,
+    KlineStream,
+    RefreshSchedule,
+    SignalCache,
+    TradingSignal,
+    async_event_loop,
+    async_transport_available,
+    load_rules,
+    strategy,
+    stream_available
+)
 
-class TradingSignal:
-    """Handle API calls to Binance"""
-    
-    BASE_URL = "https://api.binance.com/api/v3/klines"
-    
-    def __init__(self, symbol="BTCUSDT"):
-        self.symbol = symbol
-        
-    def fetch_data(self, interval="1h", limit=100):
-        """Fetch price data from Binance"""
-        try:
-            params = {
-                "symbol": self.symbol,
-                "interval": interval,
-                "limit": limit
-            }
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
-            data = response.json()
-            
-            # Parse data
-            prices = []
-            for candle in data:
-                prices.append({
-                    'timestamp': candle[0],
-                    'open': float(candle[1]),
-                    'high': float(candle[2]),
-                    'low': float(candle[3]),
-                    'close': float(candle[4]),
-                    'volume': float(candle[5])
-                })
-            
-            return prices
-        except Exception as e:
-            print(f"Error fetching data: {e}")
-            return []
-    
-    def calculate_rsi(self, prices, period=14):
-        """Calculate RSI"""
-        if len(prices) < period + 1:
-            return 50.0
-        
-        closes = [p['close'] for p in prices]
-        deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-        
-        gains = [d if d > 0 else 0 for d in deltas[-period:]]
-        losses = [-d if d < 0 else 0 for d in deltas[-period:]]
-        
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-    
-    def calculate_sma(self, prices, period):
-        """Calculate Simple Moving Average"""
-        if len(prices) < period:
-            return 0
-        closes = [p['close'] for p in prices[-period:]]
-        return sum(closes) / period
-    
-    def generate_signal(self, interval="1h"):
-        """Generate trading signal"""
-        prices = self.fetch_data(interval=interval, limit=100)
-        
-        if not prices:
-            return {
-                'symbol': self.symbol,
-                'price': 0,
-                'signal': 'ERROR',
-                'strength': 0,
-                'rsi': 0,
-                'sma_20': 0,
-                'sma_50': 0,
-                'recommendation': 'Unable to fetch data'
-            }
-        
-        current_price = prices[-1]['close']
-        rsi = self.calculate_rsi(prices)
-        sma_20 = self.calculate_sma(prices, 20)
-        sma_50 = self.calculate_sma(prices, 50)
-        
-        # Generate signal
-        buy_signals = 0
-        sell_signals = 0
-        
-        if rsi < 30:
-            buy_signals += 1
-        elif rsi > 70:
-            sell_signals += 1
-            
-        if sma_20 > sma_50:
-            buy_signals += 1
-        elif sma_20 < sma_50:
-            sell_signals += 1
-        
-        if buy_signals >= 2:
-            signal = 'BUY'
-            strength = buy_signals
-            recommendation = f"Strong BUY signal detected"
-        elif sell_signals >= 2:
-            signal = 'SELL'
-            strength = sell_signals
-            recommendation = f"Strong SELL signal detected"
-        else:
-            signal = 'HOLD'
-            strength = 0
-            recommendation = "No clear signal - HOLD position"
-        
-        return {
-            'symbol': self.symbol,
-            'price': current_price,
-            'signal': signal,
-            'strength': strength,
-            'rsi': rsi,
-            'sma_20': sma_20,
-            'sma_50': sma_50,
-            'recommendation': recommendation,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+# Candles kept on the chart
+CHART_CANDLES = 1000
+
+# Interval buttons; multi-timeframe mode adds the next two coarser ones
+INTERVALS = ['5m', '15m', '1h', '4h', '1d']
 
+# Set window size for testing
+Window.size = (360, 640)
 
 class MainScreen(Screen):
     """Main screen showing trading signals"""
     
-    def __init__(self, **kwargs):
+    def __init__(self, store=None, rules=None, **kwargs):
         super().__init__(**kwargs)
+        self.store = store
+        self.rules = rules
+        self.cache = SignalCache()
         self.current_symbol = 'BTCUSDT'
         self.current_interval = '1h'
+        self.workers = CoalescingExecutor(max_workers=2)
+        self._tasks = {}
+        self._generation = 0
+        self.stream = None
+        self._stream_signal = None
+        self._show_stream_signal = Clock.create_trigger(self.show_stream_signal)
+        self._chart_key = None
+        self._chart_version = None
+        self.confluence = False
+        self.schedule = RefreshSchedule()
+        self._wakeup = None
         self.build_ui()
         
-        # Auto-refresh every 5 minutes
-        Clock.schedule_interval(self.refresh_signal, 300)
+        # Auto-refresh just after each candle close
+        self.reschedule()
         
-        # Load initial signal
+        # Load initial signal, then follow live updates
         Clock.schedule_once(lambda dt: self.refresh_signal(), 1)
+        Clock.schedule_once(lambda dt: self.restart_stream(), 1)
     
     def build_ui(self):
         """Build the user interface"""
@@ -178,6 +92,15 @@ class MainScreen(Screen):
             color=(1, 1, 1, 1)
         )
         header.add_widget(title)
+        
+        watchlist_btn = Button(
+            text='☰ All',
+            size_hint_x=0.25,
+            background_color=(0, 0, 0, 0),
+            font_size='16sp'
+        )
+        watchlist_btn.bind(on_press=lambda x: self.show_watchlist())
+        header.add_widget(watchlist_btn)
         layout.add_widget(header)
         
         # Symbol selector
@@ -193,8 +116,8 @@ class MainScreen(Screen):
         layout.add_widget(symbol_layout)
         
         # Interval selector
-        interval_layout = GridLayout(cols=5, size_hint_y=0.1, spacing=5)
-        for interval in ['5m', '15m', '1h', '4h', '1d']:
+        interval_layout = GridLayout(cols=6, size_hint_y=0.1, spacing=5)
+        for interval in INTERVALS:
             btn = Button(
                 text=interval,
                 background_color=(0.3, 0.3, 0.3, 1),
@@ -202,16 +125,30 @@ class MainScreen(Screen):
             )
             btn.bind(on_press=lambda x, i=interval: self.change_interval(i))
             interval_layout.add_widget(btn)
+        mtf_btn = ToggleButton(
+            text='MTF',
+            background_color=(0.4, 0.49, 0.92, 1),
+            font_size='14sp'
+        )
+        mtf_btn.bind(state=lambda x, state: self.set_confluence(state == 'down'))
+        interval_layout.add_widget(mtf_btn)
         layout.add_widget(interval_layout)
         
+        # Chart
+        self.chart = CandleChart(size_hint_y=0.22)
+        layout.add_widget(self.chart)
+        
         # Signal display
         self.signal_container = BoxLayout(orientation='vertical', spacing=10)
-        self.signal_container.add_widget(Label(
+        self.loading_label = Label(
             text='Loading...',
-            font_size='20sp'
-        ))
+            font_size='20sp',
+            color=(0.7, 0.7, 0.7, 1)
+        )
+        self.signal_container.add_widget(self.loading_label)
+        self.build_signal_card()
         
-        scroll = ScrollView(size_hint=(1, 0.58))
+        scroll = ScrollView(size_hint=(1, 0.36))
         scroll.add_widget(self.signal_container)
         layout.add_widget(scroll)
         
@@ -234,125 +171,327 @@ class MainScreen(Screen):
     
     def change_symbol(self, symbol):
         """Change trading symbol"""
-        self.current_symbol = f"{symbol}USDT"
-        self.refresh_signal()
+        self.select_symbol(f"{symbol}USDT")
+    
+    def select_symbol(self, symbol):
+        """Switch to a full pair name such as BTCUSDT"""
+        self.current_symbol = symbol
+        self.refresh_signal(revalidate=False)
+        self.restart_stream()
+        self.reschedule()
+    
+    def show_watchlist(self):
+        """Open the watchlist on the current timeframe"""
+        watchlist = self.manager.get_screen('watchlist')
+        watchlist.interval = self.current_interval
+        self.manager.current = 'watchlist'
     
     def change_interval(self, interval):
         """Change timeframe"""
         self.current_interval = interval
+        self.refresh_signal(revalidate=False)
+        self.restart_stream()
+        self.reschedule()
+    
+    def reschedule(self):
+        """Wake up when the current symbol's candle closes"""
+        self.schedule.unwatch()
+        self.schedule.watch(self.current_symbol, self.current_interval)
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup = Clock.schedule_once(self.on_candle_close, self.schedule.delay())
+    
+    def on_candle_close(self, dt):
+        """Refetch once the candle has closed, then wait for the next close"""
+        if self.schedule.pop_due():
+            self.refresh_signal()
+        self._wakeup = Clock.schedule_once(self.on_candle_close, self.schedule.delay())
+    
+    def set_confluence(self, enabled):
+        """Toggle multi-timeframe signals for the current interval"""
+        self.confluence = enabled
         self.refresh_signal()
     
-    def refresh_signal(self, *args):
-        """Refresh trading signal"""
-        self.signal_container.clear_widgets()
-        
-        # Show loading
-        loading = Label(
-            text='⏳ Loading signal...',
-            font_size='18sp',
-            color=(0.7, 0.7, 0.7, 1)
+    def higher_timeframes(self):
+        """Coarser intervals combined with the current one in multi-timeframe mode"""
+        if self.current_interval not in INTERVALS:
+            return ()
+        index = INTERVALS.index(self.current_interval)
+        return tuple(INTERVALS[index + 1:index + 3])
+    
+    def restart_stream(self):
+        """Follow the live kline stream for the current symbol and interval"""
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+        if not stream_available():
+            return
+        
+        trader = TradingSignal(self.current_symbol, store=self.store)
+        interval = self.current_interval
+        key = (self.current_symbol, interval)
+        self.stream = KlineStream(
+            self.current_symbol,
+            interval,
+            on_signal=lambda signal: self.on_stream_signal(key, signal),
+            rest_fetch=lambda: (trader.fetch_data(interval=interval, limit=100), trader.served_stale),
+            store=self.store
+        ).start()
+    
+    def on_stream_signal(self, key, signal):
+        """Queue a live update; called from the stream thread"""
+        self._stream_signal = (key, signal)
+        # Signals seeded from fallback candles must not pass for fresh ones
+        if signal['signal'] != 'ERROR' and not signal.get('stale'):
+            self.cache.put(*key, signal)
+        self._show_stream_signal()
+    
+    def show_stream_signal(self, *args):
+        """Render the newest live update, at most once per frame"""
+        if self._stream_signal is None:
+            return
+        key, signal = self._stream_signal
+        if key == (self.current_symbol, self.current_interval):
+            # Live ticks use the built-in rules on the base interval only
+            if not self.confluence and self.rules is None:
+                self.display_signal(signal)
+            self.update_chart()
+    
+    def refresh_signal(self, *args, revalidate=True):
+        """Refresh trading signal; revalidate=False skips the fetch while the cached candle is open"""
+        symbol = self.current_symbol
+        interval = self.current_interval
+        key = (symbol, interval)
+        trader = TradingSignal(symbol, store=self.store, cache=self.cache, rules=self.rules)
+        
+        # Only the newest refresh may render its result
+        self._generation += 1
+        generation = self._generation
+        
+        # Render the last known signal right away, otherwise show loading
+        cached = trader.cached_signal(interval)
+        if cached is not None:
+            self.display_signal(cached)
+        else:
+            self.set_widget(self.loading_label, text='⏳ Loading signal...', font_size='18sp')
+            self.show_in_container(self.loading_label)
+        self.update_chart()
+        if not revalidate and not self.confluence and self.cache.fresh(symbol, interval):
+            return
+        
+        if self.confluence:
+            higher = self.higher_timeframes()
+            key = (symbol, interval, 'mtf') + higher
+            fetch, fetch_async = trader.confluence_signal, self.fetch_confluence_async
+            args = (interval, higher)
+        else:
+            fetch, fetch_async = trader.generate_signal, self.fetch_async
+            args = (interval,)
+        
+        # Fetch on the app's event loop when running async, otherwise on the worker pool
+        if self._event_loop() is not None:
+            for other, task in list(self._tasks.items()):
+                if other != key or task.done():
+                    task.cancel()
+                    del self._tasks[other]
+            task = self._tasks.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fetch_async(symbol, *args))
+                self._tasks[key] = task
+            task.add_done_callback(lambda done: self._deliver(generation, symbol, done))
+            return
+        
+        self.workers.cancel_pending(keep=key)
+        future = self.workers.submit(key, fetch, *args)
+        future.add_done_callback(
+            lambda done: Clock.schedule_once(lambda dt: self._deliver(generation, symbol, done), 0)
         )
-        self.signal_container.add_widget(loading)
-        
-        # Fetch signal in background
-        def fetch():
-            trader = TradingSignal(self.current_symbol)
-            signal = trader.generate_signal(self.current_interval)
-            Clock.schedule_once(lambda dt: self.display_signal(signal), 0)
-        
-        import threading
-        thread = threading.Thread(target=fetch)
-        thread.start()
     
-    def display_signal(self, signal):
-        """Display the trading signal"""
-        self.signal_container.clear_widgets()
+    def _deliver(self, generation, symbol, future):
+        """Display a finished fetch unless a newer refresh superseded it"""
+        if generation != self._generation or future.cancelled():
+            return
+        if future.exception() is not None:
+            self.display_signal(strategy.error_signal(symbol))
+            return
+        self.display_signal(future.result())
+        self.update_chart()
+    
+    def update_chart(self):
+        """Redraw the chart from the candle store, skipped while its stored candles are unchanged"""
+        if self.store is None:
+            return
+        key = (self.current_symbol, self.current_interval)
+        version = self.store.version(*key)
+        if key == self._chart_key and version == self._chart_version:
+            return
+        if key != self._chart_key:
+            self._chart_key = key
+            self.chart.offset = 0.0
+        self._chart_version = version
+        self.chart.set_candles(self.store.load(*key, limit=CHART_CANDLES))
+    
+    def _event_loop(self):
+        """Running asyncio loop usable for I/O, or None"""
+        return async_event_loop()
+    
+    async def fetch_async(self, symbol, interval):
+        """Fetch a signal without leaving the event loop"""
+        trader = AsyncTradingSignal(symbol, store=self.store, cache=self.cache, rules=self.rules)
+        return await trader.generate_signal(interval)
+    
+    async def fetch_confluence_async(self, symbol, interval, higher):
+        """Fetch a multi-timeframe signal without leaving the event loop"""
+        trader = AsyncTradingSignal(symbol, store=self.store, cache=self.cache, rules=self.rules)
+        return await trader.confluence_signal(interval, higher)
+    
+    def build_signal_card(self):
+        """Create the signal card widgets once; display_signal updates them in place"""
+        self.signal_card = BoxLayout(orientation='vertical', spacing=10)
         
         # Price
-        price_label = Label(
-            text=f"[b]${signal['price']:,.2f}[/b]",
+        self.price_label = Label(
+            text='',
             markup=True,
             font_size='48sp',
             size_hint_y=0.3
         )
-        self.signal_container.add_widget(price_label)
+        self.signal_card.add_widget(self.price_label)
         
         # Signal
-        signal_colors = {
-            'BUY': (0.22, 0.93, 0.49, 1),  # Green
-            'SELL': (0.92, 0.36, 0.26, 1),  # Red
-            'HOLD': (0.7, 0.7, 0.7, 1),     # Gray
-            'ERROR': (1, 0.5, 0, 1)          # Orange
-        }
-        
-        signal_box = BoxLayout(orientation='vertical', size_hint_y=0.2)
-        signal_label = Label(
-            text=f"[b]{signal['signal']}[/b]",
+        self.signal_box = BoxLayout(orientation='vertical', size_hint_y=0.2)
+        self.signal_label = Label(
+            text='',
             markup=True,
-            font_size='32sp',
-            color=signal_colors.get(signal['signal'], (1, 1, 1, 1))
+            font_size='32sp'
         )
-        
-        if signal['signal'] != 'HOLD' and signal['signal'] != 'ERROR':
-            strength_label = Label(
-                text=f"Strength: {signal['strength']}/4",
-                font_size='16sp',
-                color=(0.8, 0.8, 0.8, 1)
-            )
-            signal_box.add_widget(signal_label)
-            signal_box.add_widget(strength_label)
-        else:
-            signal_box.add_widget(signal_label)
-        
-        self.signal_container.add_widget(signal_box)
+        self.strength_label = Label(
+            text='',
+            font_size='16sp',
+            color=(0.8, 0.8, 0.8, 1)
+        )
+        self.signal_box.add_widget(self.signal_label)
+        self.signal_card.add_widget(self.signal_box)
         
         # Indicators
         indicators = GridLayout(cols=2, spacing=10, size_hint_y=0.3)
-        
-        indicators_data = [
-            ('RSI', f"{signal['rsi']:.2f}"),
-            ('SMA 20', f"${signal['sma_20']:.2f}"),
-            ('SMA 50', f"${signal['sma_50']:.2f}"),
-            ('Time', signal['timestamp'].split()[1])
-        ]
-        
-        for label, value in indicators_data:
+        self.indicator_values = {}
+        for label in ('RSI', 'SMA 20', 'SMA 50', 'Time'):
             indicator_box = BoxLayout(orientation='vertical', padding=5)
-            with indicator_box.canvas.before:
-                Color(0.2, 0.2, 0.2, 0.5)
-                RoundedRectangle(pos=indicator_box.pos, size=indicator_box.size, radius=[5])
+            self.add_background(indicator_box, (0.2, 0.2, 0.2, 0.5), 5)
             
             indicator_box.add_widget(Label(
                 text=label,
                 font_size='14sp',
                 color=(0.7, 0.7, 0.7, 1)
             ))
-            indicator_box.add_widget(Label(
-                text=value,
+            value_label = Label(
+                text='',
                 font_size='18sp',
                 bold=True
-            ))
+            )
+            indicator_box.add_widget(value_label)
+            self.indicator_values[label] = value_label
             indicators.add_widget(indicator_box)
         
-        self.signal_container.add_widget(indicators)
+        self.signal_card.add_widget(indicators)
         
         # Recommendation
         rec_box = BoxLayout(orientation='vertical', size_hint_y=0.2, padding=10)
-        with rec_box.canvas.before:
-            Color(0.4, 0.49, 0.92, 0.2)
-            RoundedRectangle(pos=rec_box.pos, size=rec_box.size, radius=[10])
+        self.add_background(rec_box, (0.4, 0.49, 0.92, 0.2), 10)
         
         rec_box.add_widget(Label(
             text='💡 Recommendation',
             font_size='16sp',
             bold=True
         ))
-        rec_box.add_widget(Label(
-            text=signal['recommendation'],
+        self.recommendation_label = Label(
+            text='',
             font_size='14sp',
             color=(0.9, 0.9, 0.9, 1)
-        ))
-        self.signal_container.add_widget(rec_box)
+        )
+        rec_box.add_widget(self.recommendation_label)
+        self.signal_card.add_widget(rec_box)
+    
+    def add_background(self, widget, color, radius):
+        """Rounded background that follows the widget's position and size"""
+        with widget.canvas.before:
+            Color(*color)
+            rect = RoundedRectangle(pos=widget.pos, size=widget.size, radius=[radius])
+        widget.bind(pos=lambda instance, value: setattr(rect, 'pos', value))
+        widget.bind(size=lambda instance, value: setattr(rect, 'size', value))
+    
+    def show_in_container(self, widget):
+        """Make widget the only child of the signal container"""
+        if widget.parent is not self.signal_container:
+            self.signal_container.clear_widgets()
+            self.signal_container.add_widget(widget)
+    
+    @staticmethod
+    def set_widget(widget, **values):
+        """Assign only the properties whose value actually changed"""
+        for name, value in values.items():
+            if isinstance(value, tuple):
+                value = list(value)
+            if getattr(widget, name) != value:
+                setattr(widget, name, value)
+    
+    def display_signal(self, signal):
+        """Display the trading signal"""
+        self.show_in_container(self.signal_card)
+        
+        # Price
+        self.set_widget(self.price_label, text=f"[b]${signal['price']:,.2f}[/b]")
+        
+        # Signal
+        signal_colors = {
+            'BUY': (0.22, 0.93, 0.49, 1),  # Green
+            'SELL': (0.92, 0.36, 0.26, 1),  # Red
+            'HOLD': (0.7, 0.7, 0.7, 1),     # Gray
+            'ERROR': (1, 0.5, 0, 1)          # Orange
+        }
+        self.set_widget(
+            self.signal_label,
+            text=f"[b]{signal['signal']}[/b]",
+            color=signal_colors.get(signal['signal'], (1, 1, 1, 1))
+        )
+        
+        if signal.get('timeframes'):
+            self.set_widget(self.strength_label, text='  ·  '.join(
+                f"{interval} {frame}" for interval, frame in signal['timeframes'].items()
+            ))
+            if self.strength_label.parent is None:
+                self.signal_box.add_widget(self.strength_label)
+        elif signal['signal'] != 'HOLD' and signal['signal'] != 'ERROR':
+            self.set_widget(self.strength_label, text=f"Strength: {signal['strength']}/4")
+            if self.strength_label.parent is None:
+                self.signal_box.add_widget(self.strength_label)
+        elif self.strength_label.parent is not None:
+            self.signal_box.remove_widget(self.strength_label)
+        
+        # Indicators
+        timestamp = signal.get('timestamp')
+        stale = signal.get('stale', False)
+        if stale:
+            # Offline: the time of the newest candle, not when it was computed
+            time_text = signal['candle_time'][5:16]
+        else:
+            time_text = timestamp.split()[1] if timestamp else '--'
+        indicators_data = (
+            ('RSI', f"{signal['rsi']:.2f}"),
+            ('SMA 20', f"${signal['sma_20']:.2f}"),
+            ('SMA 50', f"${signal['sma_50']:.2f}"),
+            ('Time', time_text)
+        )
+        for label, value in indicators_data:
+            self.set_widget(self.indicator_values[label], text=value)
+        self.set_widget(self.indicator_values['Time'], color=(1, 0.5, 0, 1) if stale else (1, 1, 1, 1))
+        
+        # Recommendation
+        recommendation = signal['recommendation']
+        if stale:
+            recommendation = f"Offline - last data {signal['candle_time'][:16]}\n{recommendation}"
+        self.set_widget(self.recommendation_label, text=recommendation)
 
 
 class TradingBotApp(App):
@@ -360,10 +499,43 @@ class TradingBotApp(App):
     
     def build(self):
         """Build the app"""
+        self.store = CandleStore(os.path.join(self.user_data_dir, 'candles.db'))
+        rules = self.load_user_rules()
         sm = ScreenManager()
-        sm.add_widget(MainScreen(name='main'))
+        main = MainScreen(name='main', store=self.store, rules=rules)
+        sm.add_widget(main)
+        sm.add_widget(WatchlistScreen(name='watchlist', store=self.store, rules=rules, on_select=self.open_symbol))
         return sm
+    
+    def load_user_rules(self):
+        """Custom signal rules from rules.json or rules.yaml in the app's data directory"""
+        for name in ('rules.json', 'rules.yaml', 'rules.yml'):
+            path = os.path.join(self.user_data_dir, name)
+            if os.path.exists(path):
+                try:
+                    return load_rules(path)
+                except Exception as e:
+                    print(f"Ignoring {name}: {e}")
+        return None
+    
+    def open_symbol(self, symbol):
+        """Show a symbol picked from the watchlist on the main screen"""
+        self.root.get_screen('main').select_symbol(symbol)
+        self.root.current = 'main'
+    
+    def on_stop(self):
+        """Stop background fetches and close the candle store"""
+        main = self.root.get_screen('main')
+        if main.stream is not None:
+            main.stream.stop()
+        main.workers.shutdown()
+        self.root.get_screen('watchlist').stop()
+        self.store.close()
 
 
 if __name__ == '__main__':
-    TradingBotApp().run()
+    # Run on Kivy's asyncio loop when aiohttp is installed so fetches need no threads
+    if async_transport_available():
+        asyncio.run(TradingBotApp().async_run(async_lib='asyncio'))
+    else:
+        TradingBotApp().run()
@@ -0,0 +1,69 @@
+"""
+Signal engine
+Headless data, indicator and signal code shared by the app and scripts
+
+Nothing here imports Kivy. Public names are resolved lazily on first
+access, so `import signal_engine` loads no submodule and none of the
+heavy dependencies (numpy, requests, aiohttp, websocket-client).
+"""
+
+import importlib
+
+_EXPORTS = {
+    'TradingSignal': 'client',
+    'AsyncTradingSignal': 'client',
+    'SignalScanner': 'scanner',
+    'CandleSeries': 'candles',
+    'INTERVAL_MS': 'candles',
+    'candle_close_ms': 'candles',
+    'SignalCache': 'cache',
+    'RefreshSchedule': 'schedule',
+    'CandleStore': 'candle_store',
+    'resample_many': 'resample',
+    'decode_klines': 'klines_decode',
+    'HttpTransport': 'transport',
+    'AsyncHttpTransport': 'transport',
+    'RateBudget': 'transport',
+    'WeightGovernor': 'transport',
+    'RateLimited': 'transport',
+    'get_governor': 'transport',
+    'ResilientTransport': 'resilience',
+    'CircuitBreaker': 'resilience',
+    'CircuitOpen': 'resilience',
+    'get_resilient_transport': 'resilience',
+    'get_transport': 'transport',
+    'configure_transport': 'transport',
+    'get_async_transport': 'transport',
+    'async_transport_available': 'transport',
+    'async_event_loop': 'transport',
+    'StreamingSignal': 'streaming',
+    'RollingSMA': 'streaming',
+    'RollingRSI': 'streaming',
+    'WilderRSI': 'streaming',
+    'KlineStream': 'kline_stream',
+    'stream_available': 'kline_stream',
+    'CoalescingExecutor': 'workers',
+    'IndicatorCache': 'indicators',
+    'run_backtest': 'backtest',
+    'RuleSet': 'rules',
+    'load_rules': 'rules',
+    'default_rules': 'rules',
+    'optimize': 'optimizer',
+    'walk_forward': 'walkforward',
+    'SignalDaemon': 'daemon'
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,119 @@
+"""
+Deep-history backfill
+Page klines backward over a time range in parallel and stitch them
+
+The range is cut into pages of PAGE_LIMIT candles on a fixed grid, each
+fetched with startTime/endTime so pages never overlap. With a CandleStore
+every page is merged as soon as it arrives and marked complete, so an
+interrupted backfill, or a rerun over an overlapping range, only fetches
+the pages it is missing.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from .candles import INTERVAL_MS, INTERVAL_OFFSET_MS, CandleSeries
+from .klines_decode import decode_klines
+from .resilience import get_resilient_transport
+from .transport import RateBudget
+
+
+KLINES_URL = "https://api.binance.com/api/v3/klines"
+
+# Largest page the klines endpoint returns
+PAGE_LIMIT = 1000
+
+
+def plan_pages(interval, start_time, end_time, page_limit=PAGE_LIMIT):
+    """Split [start_time, end_time] into (page_start, page_end) windows of page_limit candles
+
+    Pages sit on a grid of page_limit candles counted from the exchange's
+    candle alignment, not from start_time, so ranges starting at different
+    times share their pages; only the first and last are clipped.
+    """
+    interval_ms = INTERVAL_MS[interval]
+    offset = INTERVAL_OFFSET_MS.get(interval, 0)
+    start = start_time - (start_time - offset) % interval_ms
+    span = page_limit * interval_ms
+    first = start - (start - offset) % span
+    return [
+        (max(page_start, start), min(page_start + span - 1, end_time))
+        for page_start in range(first, end_time + 1, span)
+    ]
+
+
+def find_gaps(prices, interval):
+    """(last_before_gap, first_after_gap) open times where candles are missing"""
+    if len(prices) < 2:
+        return []
+    steps = np.diff(prices.timestamp)
+    missing = np.nonzero(steps != INTERVAL_MS[interval])[0]
+    return [(int(prices.timestamp[i]), int(prices.timestamp[i + 1])) for i in missing]
+
+
+def _stitch(pages):
+    """Join pages into one series ordered by open time without duplicates"""
+    pages = [page for page in pages if len(page)]
+    if not pages:
+        return CandleSeries.empty()
+    columns = [
+        np.concatenate([getattr(page, name) for page in pages])
+        for name in CandleSeries.__slots__
+    ]
+    _, first = np.unique(columns[0], return_index=True)
+    return CandleSeries(*(column[first] for column in columns))
+
+
+def backfill(symbol, interval, start_time, end_time=None, store=None, transport=None,
+             max_workers=8, budget=None, on_page=None):
+    """Download every candle with open time in [start_time, end_time]
+
+    Times are epoch milliseconds; end_time defaults to now. Pages are
+    fetched on max_workers threads, each spending one token from budget
+    (a RateBudget shared with other callers if given). on_page(done, total)
+    reports progress. Returns the stitched CandleSeries.
+    """
+    transport = transport or get_resilient_transport()
+    budget = budget or RateBudget(10)
+    now = int(time.time() * 1000)
+    end_time = min(end_time if end_time is not None else now, now)
+
+    pages = plan_pages(interval, start_time, end_time)
+    interval_ms = INTERVAL_MS[interval]
+    done = store.completed_pages(symbol, interval) if store is not None else set()
+    pending = [page for page in pages if page not in done]
+
+    def fetch_page(page):
+        page_start, page_end = page
+        budget.acquire()
+        response = transport.get(KLINES_URL, params={
+            "symbol": symbol,
+            "interval": interval,
+            "startTime": page_start,
+            "endTime": page_end,
+            "limit": PAGE_LIMIT
+        })
+        prices = decode_klines(response.content)
+        if store is not None:
+            store.merge(symbol, interval, prices)
+            # A page still containing the open candle is not final yet
+            if page_end + interval_ms <= now:
+                store.mark_page(symbol, interval, page_start, page_end)
+        return prices
+
+    fetched = []
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            futures = [pool.submit(fetch_page, page) for page in pending]
+            for count, future in enumerate(as_completed(futures), 1):
+                fetched.append(future.result())
+                if on_page is not None:
+                    on_page(len(pages) - len(pending) + count, len(pages))
+
+    if store is not None:
+        return store.load_range(symbol, interval, start_time, end_time)
+    prices = _stitch(fetched)
+    first, last = np.searchsorted(prices.timestamp, [start_time, end_time + 1])
+    return prices[first:last]
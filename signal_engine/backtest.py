@@ -0,0 +1,96 @@
+"""
+Vectorized backtester
+Replay the generate_signal rules over a full candle history
+
+Signals are voted on every bar at once from full indicator series. A BUY
+opens a long at that bar's close and a SELL closes it; with
+allow_short=True a SELL flips to short instead. Fees are charged as a
+fraction of equity on every change of position.
+"""
+
+import numpy as np
+
+from . import indicators, strategy
+
+
+def _hold_signals(votes):
+    """Carry the last non-HOLD vote forward, giving the position after each bar"""
+    index = np.where(votes != 0, np.arange(len(votes)), 0)
+    np.maximum.accumulate(index, out=index)
+    held = votes[index]
+    if len(votes) and votes[0] == 0:
+        # Bars before the first vote keep the flat position
+        held[index == 0] = 0
+    return held
+
+
+def strategy_votes(closes, rsi_period=14, sma_fast=20, sma_slow=50,
+                   oversold=strategy.RSI_OVERSOLD, overbought=strategy.RSI_OVERBOUGHT):
+    """Per-bar BUY/SELL/HOLD votes for one parameter set"""
+    return strategy.vote_series(
+        indicators.rsi(closes, rsi_period),
+        indicators.sma(closes, sma_fast),
+        indicators.sma(closes, sma_slow),
+        oversold,
+        overbought
+    )
+
+
+def backtest_votes(closes, votes, fee=0.001, allow_short=False):
+    """Trades, equity curve and statistics for precomputed per-bar votes"""
+    closes = np.asarray(closes, dtype=np.float64)
+    position = _hold_signals(votes).astype(np.float64)
+    if not allow_short:
+        position = np.maximum(position, 0.0)
+
+    # Each bar earns the return on the position held since the previous close
+    held_returns = np.zeros(len(closes))
+    held_returns[1:] = position[:-1] * (closes[1:] / closes[:-1] - 1)
+    turnover = np.abs(np.diff(position, prepend=0.0))
+    equity = np.cumprod((1.0 + held_returns) * (1.0 - fee * turnover))
+    drawdown = equity / np.maximum.accumulate(equity) - 1 if len(equity) else equity
+
+    # A trade runs from a position change to the next one; an open trade is marked at the last close
+    changes = np.nonzero(turnover)[0]
+    entries = changes[position[changes] != 0]
+    exit_points = np.append(changes, len(closes) - 1)
+    exits = exit_points[np.minimum(np.searchsorted(exit_points, entries, side='right'), len(exit_points) - 1)]
+    sides = position[entries]
+    trade_returns = (
+        (1 + sides * (closes[exits] / closes[entries] - 1)) * (1 - fee) ** 2 - 1
+        if len(entries) else np.empty(0)
+    )
+
+    return {
+        'trades': {
+            'entry_index': entries,
+            'exit_index': exits,
+            'side': sides,
+            'entry_price': closes[entries],
+            'exit_price': closes[exits],
+            'return': trade_returns
+        },
+        'equity': equity,
+        'drawdown': drawdown,
+        'position': position,
+        'total_return': float(equity[-1] - 1) if len(equity) else 0.0,
+        'max_drawdown': float(drawdown.min()) if len(drawdown) else 0.0,
+        'trade_count': int(len(entries)),
+        'win_rate': float((trade_returns > 0).mean()) if len(entries) else 0.0
+    }
+
+
+def run_backtest(prices, rsi_period=14, sma_fast=20, sma_slow=50,
+                 oversold=strategy.RSI_OVERSOLD, overbought=strategy.RSI_OVERBOUGHT,
+                 fee=0.001, allow_short=False, rules=None):
+    """Backtest the signal rules over a CandleSeries or array of closes
+
+    With a RuleSet the votes come from its rules and the indicator
+    parameters are ignored.
+    """
+    closes = np.asarray(getattr(prices, 'close', prices), dtype=np.float64)
+    if rules is not None:
+        votes = rules.evaluate(prices)['votes']
+    else:
+        votes = strategy_votes(closes, rsi_period, sma_fast, sma_slow, oversold, overbought)
+    return backtest_votes(closes, votes, fee=fee, allow_short=allow_short)
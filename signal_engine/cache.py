@@ -0,0 +1,73 @@
+"""
+Signal cache
+In-memory LRU of recent signals and candle windows per (symbol, interval)
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from .candles import INTERVAL_MS, candle_close_ms
+
+
+# Lifetime for intervals without a known candle length
+DEFAULT_TTL = 60
+
+CacheEntry = namedtuple('CacheEntry', 'signal prices expires_at')
+
+
+class SignalCache:
+    """LRU of signals that stay fresh until their candle closes
+
+    Expired entries are still returned by get() so a view switch can render
+    the last known signal at once while a refetch runs (stale-while-revalidate);
+    fresh() tells whether that refetch is needed at all.
+    """
+
+    def __init__(self, max_entries=64, clock=time.time):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def expires_at(self, interval):
+        """Seconds timestamp at which a signal computed now goes stale"""
+        now = self.clock()
+        if interval not in INTERVAL_MS:
+            return now + DEFAULT_TTL
+        return candle_close_ms(interval, int(now * 1000)) / 1000
+
+    def put(self, symbol, interval, signal, prices=None):
+        """Store a signal; prices=None keeps the previously cached window"""
+        key = (symbol, interval)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if prices is None and previous is not None:
+                prices = previous.prices
+            self._entries[key] = CacheEntry(signal, prices, self.expires_at(interval))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, symbol, interval):
+        """Latest entry for the pair, fresh or stale, or None"""
+        key = (symbol, interval)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def fresh(self, symbol, interval):
+        """Whether the cached signal's candle is still open"""
+        entry = self.get(symbol, interval)
+        return entry is not None and self.clock() < entry.expires_at
+
+    def invalidate(self, symbol=None, interval=None):
+        """Drop entries matching symbol and/or interval (everything by default)"""
+        with self._lock:
+            for key in list(self._entries):
+                if (symbol is None or key[0] == symbol) and (interval is None or key[1] == interval):
+                    del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
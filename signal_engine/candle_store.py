@@ -0,0 +1,127 @@
+"""
+Local candle store
+SQLite-backed OHLCV cache keyed by (symbol, interval)
+"""
+
+import os
+import sqlite3
+import threading
+
+from .candles import CandleSeries
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL,
+    PRIMARY KEY (symbol, interval, timestamp)
+) WITHOUT ROWID
+"""
+
+
+BACKFILL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backfill_pages (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval, start_time, end_time)
+) WITHOUT ROWID
+"""
+
+
+def default_store_path():
+    """Location of the candle database when the app does not provide one"""
+    base = os.environ.get('TRADINGBOT_DATA_DIR') or os.path.join(os.path.expanduser('~'), '.tradingbot')
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, 'candles.db')
+
+
+class CandleStore:
+    """Persist candles on device so refreshes only fetch what changed"""
+
+    def __init__(self, path=None):
+        self.path = path or default_store_path()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(SCHEMA)
+            self._conn.execute(BACKFILL_SCHEMA)
+            self._conn.commit()
+
+    def version(self, symbol, interval):
+        """(row count, newest open time, newest close): changes whenever stored candles do"""
+        with self._lock:
+            # SQLite takes the bare close column from the row holding MAX(timestamp)
+            row = self._conn.execute(
+                "SELECT COUNT(*), MAX(timestamp), close FROM candles WHERE symbol = ? AND interval = ?",
+                (symbol, interval)
+            ).fetchone()
+        return tuple(row)
+
+    def load(self, symbol, interval, limit=100):
+        """Return the newest `limit` candles, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT timestamp, open, high, low, close, volume FROM candles "
+                "WHERE symbol = ? AND interval = ? ORDER BY timestamp DESC LIMIT ?",
+                (symbol, interval, limit)
+            ).fetchall()
+        rows.reverse()
+        return CandleSeries.from_rows(rows)
+
+    def load_range(self, symbol, interval, start_time, end_time):
+        """Return candles with open time in [start_time, end_time], oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT timestamp, open, high, low, close, volume FROM candles "
+                "WHERE symbol = ? AND interval = ? AND timestamp BETWEEN ? AND ? "
+                "ORDER BY timestamp",
+                (symbol, interval, start_time, end_time)
+            ).fetchall()
+        return CandleSeries.from_rows(rows)
+
+    def completed_pages(self, symbol, interval):
+        """(start_time, end_time) of backfill pages already stored"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT start_time, end_time FROM backfill_pages WHERE symbol = ? AND interval = ?",
+                (symbol, interval)
+            ).fetchall()
+        return set(rows)
+
+    def mark_page(self, symbol, interval, start_time, end_time):
+        """Record a fully downloaded backfill page so reruns can skip it"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO backfill_pages (symbol, interval, start_time, end_time) "
+                "VALUES (?, ?, ?, ?)",
+                (symbol, interval, start_time, end_time)
+            )
+            self._conn.commit()
+
+    def merge(self, symbol, interval, prices):
+        """Insert a CandleSeries, replacing candles with the same open time"""
+        if not len(prices):
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO candles "
+                "(symbol, interval, timestamp, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(symbol, interval) + row for row in prices.rows()]
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,127 @@
+"""
+Columnar candle series
+Contiguous NumPy arrays instead of one dict per candle
+"""
+
+import numpy as np
+
+
+# Candle length in milliseconds for each Binance kline interval
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 3_600_000,
+    '2h': 2 * 3_600_000,
+    '4h': 4 * 3_600_000,
+    '6h': 6 * 3_600_000,
+    '8h': 8 * 3_600_000,
+    '12h': 12 * 3_600_000,
+    '1d': 86_400_000,
+    '3d': 3 * 86_400_000,
+    '1w': 7 * 86_400_000
+}
+
+# Weekly candles open on Monday 00:00 UTC; the epoch was a Thursday
+INTERVAL_OFFSET_MS = {
+    '1w': 4 * 86_400_000
+}
+
+
+def candle_close_ms(interval, now_ms):
+    """Close time (the next candle's open time) of the candle open at now_ms"""
+    interval_ms = INTERVAL_MS[interval]
+    offset = INTERVAL_OFFSET_MS.get(interval, 0)
+    return ((now_ms - offset) // interval_ms + 1) * interval_ms + offset
+
+
+class CandleSeries:
+    """OHLCV window stored as one contiguous array per field
+
+    timestamp is int64 open time in milliseconds, the price and volume
+    columns are float64. Rows are ordered oldest first.
+    """
+
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, timestamp, open, high, low, close, volume):
+        self.timestamp = np.ascontiguousarray(timestamp, dtype=np.int64)
+        self.open = np.ascontiguousarray(open, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.volume = np.ascontiguousarray(volume, dtype=np.float64)
+
+    @classmethod
+    def empty(cls):
+        """Series with no candles"""
+        return cls._from_block(np.empty((6, 0), dtype=np.float64))
+
+    @classmethod
+    def _from_block(cls, block):
+        """Build from a (6, n) array of timestamp, open, high, low, close, volume"""
+        return cls(block[0].astype(np.int64), block[1], block[2], block[3], block[4], block[5])
+
+    @classmethod
+    def from_klines(cls, payload):
+        """Build from a Binance klines JSON payload in one pass"""
+        if not payload:
+            return cls.empty()
+        # Timestamps stay exact in float64 (well below 2**53 ms)
+        block = np.array([candle[:6] for candle in payload], dtype=np.float64)
+        return cls._from_block(block.T.copy())
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from (timestamp, open, high, low, close, volume) tuples"""
+        if not rows:
+            return cls.empty()
+        return cls._from_block(np.array(rows, dtype=np.float64).T.copy())
+
+    def __len__(self):
+        return len(self.close)
+
+    def __getitem__(self, index):
+        """Slice the series, returning a new CandleSeries"""
+        if not isinstance(index, slice):
+            raise TypeError("CandleSeries only supports slicing; use the column arrays for single values")
+        return CandleSeries(
+            self.timestamp[index], self.open[index], self.high[index],
+            self.low[index], self.close[index], self.volume[index]
+        )
+
+    def __repr__(self):
+        return f"CandleSeries({len(self)} candles)"
+
+    def tail(self, count):
+        """Newest `count` candles"""
+        return self[-count:] if count < len(self) else self
+
+    def rows(self):
+        """Iterate (timestamp, open, high, low, close, volume) tuples"""
+        return zip(
+            self.timestamp.tolist(), self.open.tolist(), self.high.tolist(),
+            self.low.tolist(), self.close.tolist(), self.volume.tolist()
+        )
+
+    def merge(self, newer):
+        """Append newer candles, replacing any that share an open time"""
+        if not len(newer):
+            return self
+        if not len(self):
+            return newer
+        keep = np.searchsorted(self.timestamp, newer.timestamp[0], side='left')
+        return CandleSeries(
+            np.concatenate((self.timestamp[:keep], newer.timestamp)),
+            np.concatenate((self.open[:keep], newer.open)),
+            np.concatenate((self.high[:keep], newer.high)),
+            np.concatenate((self.low[:keep], newer.low)),
+            np.concatenate((self.close[:keep], newer.close)),
+            np.concatenate((self.volume[:keep], newer.volume))
+        )
+
+    def nbytes(self):
+        """Memory held by the column arrays"""
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
@@ -0,0 +1,234 @@
+"""
+Signal client
+Fetch klines from Binance and turn them into trading signals
+"""
+
+import time
+
+from . import indicators, strategy
+from .candles import INTERVAL_MS, CandleSeries
+from .klines_decode import decode_klines
+from .resample import base_limit, reachable, resample_many
+from .resilience import get_async_resilient_transport, get_resilient_transport
+from .streaming import StreamingSignal
+
+
+class TradingSignal:
+    """Handle API calls to Binance"""
+
+    BASE_URL = "https://api.binance.com/api/v3/klines"
+
+    INTERVAL_MS = INTERVAL_MS
+
+    def __init__(self, symbol="BTCUSDT", transport=None, store=None, cache=None, rules=None):
+        self.symbol = symbol
+        self.transport = transport or get_resilient_transport()
+        self.store = store
+        self.cache = cache
+        self.rules = rules
+        self.served_stale = False
+
+    def fetch_data(self, interval="1h", limit=100):
+        """Fetch price data from Binance"""
+        self.served_stale = False
+        try:
+            params = self._klines_params(interval, limit)
+            response = self.transport.get(self.BASE_URL, params=params, timeout=10)
+
+            # Parse data
+            return self._store_prices(interval, limit, decode_klines(response.content))
+        except Exception as e:
+            print(f"Error fetching data: {e}")
+            return self._last_known_prices(interval, limit)
+
+    def _klines_params(self, interval, limit):
+        """Query parameters for the next klines request"""
+        params = {
+            "symbol": self.symbol,
+            "interval": interval,
+            "limit": limit
+        }
+
+        # Only ask for candles since the last stored one when the stored window
+        # has no holes and the gap since its end fits in one page
+        if self.store is not None:
+            stored = self.store.load(self.symbol, interval, limit)
+            if (len(stored) >= limit and self._contiguous(stored, interval)
+                    and self._gap_fits(stored.timestamp[-1], interval, limit)):
+                params["startTime"] = int(stored.timestamp[-1])
+        return params
+
+    def _contiguous(self, stored, interval):
+        """Check that stored candles follow each other without missing ones"""
+        interval_ms = self.INTERVAL_MS.get(interval)
+        if interval_ms is None:
+            return False
+        return stored.timestamp[-1] - stored.timestamp[0] == (len(stored) - 1) * interval_ms
+
+    def _store_prices(self, interval, limit, prices):
+        """Merge fetched candles into the store and return the current window"""
+        if self.store is None:
+            return prices
+
+        # The still-open candle is replaced by its newer version
+        self.store.merge(self.symbol, interval, prices)
+        return self.store.load(self.symbol, interval, limit)
+
+    def _last_known_prices(self, interval, limit):
+        """Stored or cached candles to show while the exchange is unreachable"""
+        prices = CandleSeries.empty()
+        if self.store is not None:
+            prices = self.store.load(self.symbol, interval, limit)
+        if not prices and self.cache is not None:
+            entry = self.cache.get(self.symbol, interval)
+            if entry is not None and entry.prices is not None:
+                prices = entry.prices[-limit:]
+        self.served_stale = bool(prices)
+        return prices
+
+    def _gap_fits(self, last_timestamp, interval, limit):
+        """Check whether candles since last_timestamp fit in a single page"""
+        interval_ms = self.INTERVAL_MS.get(interval)
+        if interval_ms is None:
+            return False
+        now_ms = int(time.time() * 1000)
+        return now_ms - last_timestamp < (limit - 1) * interval_ms
+
+    def backfill(self, interval, start_time, end_time=None, max_workers=8, on_page=None):
+        """Download deep history into the store by paging klines in parallel"""
+        from .backfill import backfill as backfill_history
+
+        return backfill_history(
+            self.symbol, interval, start_time, end_time,
+            store=self.store, transport=self.transport,
+            max_workers=max_workers, on_page=on_page
+        )
+
+    def calculate_rsi(self, prices, period=14):
+        """Calculate RSI"""
+        if len(prices) < period + 1:
+            return 50.0
+        return float(indicators.rsi(prices.close[-(period + 1):], period)[-1])
+
+    def calculate_sma(self, prices, period):
+        """Calculate Simple Moving Average"""
+        if len(prices) < period:
+            return 0
+        return float(indicators.sma(prices.close[-period:], period)[-1])
+
+    def generate_signal(self, interval="1h"):
+        """Generate trading signal"""
+        prices = self.fetch_data(interval=interval, limit=100)
+        return self._remember(interval, prices, self.signal_from_prices(prices))
+
+    def _remember(self, interval, prices, signal):
+        """Keep a freshly fetched signal and its candles in the cache"""
+        if self.cache is not None and prices and not self.served_stale:
+            self.cache.put(self.symbol, interval, signal, prices)
+        return self._flag_stale(prices, signal)
+
+    def _flag_stale(self, prices, signal):
+        """Mark a signal built from fallback candles with the newest candle's time"""
+        if self.served_stale and prices:
+            strategy.mark_stale(signal, int(prices.timestamp[-1]))
+        return signal
+
+    def confluence_signal(self, interval="1h", higher=("4h",)):
+        """Signal across `interval` and higher timeframes from one download of `interval` candles
+
+        Higher timeframes that one page of `interval` candles cannot cover
+        are skipped.
+        """
+        higher = reachable(interval, higher)
+        prices = self.fetch_data(interval=interval, limit=base_limit(interval, higher))
+        return self._flag_stale(prices, self.signal_from_frames(interval, higher, prices))
+
+    def signal_from_frames(self, interval, higher, prices):
+        """Resample a base window and apply the signal rules to every timeframe"""
+        if not prices:
+            return strategy.error_signal(self.symbol)
+        frames = resample_many(prices, interval, higher)
+        return strategy.confluence_signal(self.symbol, {
+            frame: self.signal_from_prices(candles[-100:]) for frame, candles in frames.items()
+        })
+
+    def cached_signal(self, interval="1h"):
+        """Last known signal from the cache or stored candles, or None; never fetches"""
+        if self.cache is not None:
+            entry = self.cache.get(self.symbol, interval)
+            if entry is not None:
+                return entry.signal
+        if self.store is None:
+            return None
+        prices = self.store.load(self.symbol, interval, 100)
+        if not prices:
+            return None
+        return self.signal_from_prices(prices)
+
+    def signal_from_prices(self, prices):
+        """Apply the signal rules to a candle window"""
+        if not prices:
+            return strategy.error_signal(self.symbol)
+
+        current_price = float(prices.close[-1])
+        rsi = self.calculate_rsi(prices)
+        sma_20 = self.calculate_sma(prices, 20)
+        sma_50 = self.calculate_sma(prices, 50)
+
+        # A declarative RuleSet replaces the built-in vote when given
+        voted = self.rules.latest(prices) if self.rules is not None else None
+        return strategy.build_signal(self.symbol, current_price, rsi, sma_20, sma_50, voted)
+
+    def streaming_signal(self, interval="1h", wilder=False):
+        """StreamingSignal seeded from the latest candles, for per-tick updates"""
+        stream = StreamingSignal(self.symbol, wilder=wilder)
+        stream.seed(self.fetch_data(interval=interval, limit=100))
+        return stream
+
+
+class AsyncTradingSignal(TradingSignal):
+    """TradingSignal whose network calls run on the asyncio event loop"""
+
+    def __init__(self, symbol="BTCUSDT", transport=None, store=None, cache=None, rules=None):
+        super().__init__(symbol, transport or get_async_resilient_transport(), store, cache, rules)
+
+    async def fetch_data(self, interval="1h", limit=100):
+        """Fetch price data from Binance"""
+        self.served_stale = False
+        try:
+            params = self._klines_params(interval, limit)
+            body = await self.transport.get_bytes(self.BASE_URL, params=params)
+            return self._store_prices(interval, limit, decode_klines(body))
+        except Exception as e:
+            print(f"Error fetching data: {e}")
+            return self._last_known_prices(interval, limit)
+
+    async def generate_signal(self, interval="1h"):
+        """Generate trading signal"""
+        prices = await self.fetch_data(interval=interval, limit=100)
+        return self._remember(interval, prices, self.signal_from_prices(prices))
+
+    async def confluence_signal(self, interval="1h", higher=("4h",)):
+        """Signal across `interval` and higher timeframes from one download of `interval` candles"""
+        higher = reachable(interval, higher)
+        prices = await self.fetch_data(interval=interval, limit=base_limit(interval, higher))
+        return self._flag_stale(prices, self.signal_from_frames(interval, higher, prices))
+
+    async def backfill(self, interval, start_time, end_time=None, max_workers=8, on_page=None, transport=None):
+        """Download deep history into the store without blocking the event loop
+
+        Pages are fetched on worker threads through a sync transport,
+        the process-wide resilient one unless given.
+        """
+        import asyncio
+
+        pager = TradingSignal(self.symbol, transport=transport, store=self.store)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: pager.backfill(interval, start_time, end_time, max_workers, on_page)
+        )
+
+    async def streaming_signal(self, interval="1h", wilder=False):
+        """StreamingSignal seeded from the latest candles, for per-tick updates"""
+        stream = StreamingSignal(self.symbol, wilder=wilder)
+        stream.seed(await self.fetch_data(interval=interval, limit=100))
+        return stream
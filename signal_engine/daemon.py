@@ -0,0 +1,260 @@
+"""
+Signal daemon
+Compute signals for a watchlist on a schedule and serve them over HTTP
+
+Run with:
+    python -m signal_engine.daemon --symbols BTCUSDT,ETHUSDT --intervals 1h,4h
+
+Endpoints (JSON):
+    GET /signals                     every latest signal
+    GET /signals?symbol=&interval=   filtered by symbol and/or interval
+    GET /health                      board version, last change, last sweep and
+                                     request-weight utilization
+
+/signals answers with an ETag; a request carrying a matching
+If-None-Match gets 304. Adding wait=<seconds> turns it into a long poll
+that returns as soon as the answer differs from If-None-Match, or 304 when
+nothing changed in time.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .candle_store import CandleStore
+from .rules import load_rules
+from .scanner import SignalScanner
+from .schedule import RefreshSchedule
+from .transport import get_governor
+
+
+MAX_WAIT = 60
+
+
+class SignalBoard:
+    """Latest signal per (symbol, interval) with a change counter for long polls"""
+
+    def __init__(self):
+        self.version = 0
+        self.updated_at = None
+        self.swept_at = None
+        self._signals = {}
+        self._encoded = {}
+        self._changed = threading.Condition()
+
+    def publish(self, interval, signal):
+        """Store a fresh signal and wake waiting long polls"""
+        signal = dict(signal, interval=interval)
+        key = (signal['symbol'], interval)
+        with self._changed:
+            # A recomputed but unchanged signal keeps its ETag
+            previous = self._signals.get(key)
+            if previous is not None and dict(previous, timestamp=None) == dict(signal, timestamp=None):
+                return
+            self._signals[key] = signal
+            self.version += 1
+            self.updated_at = time.time()
+            self._encoded.clear()
+            self._changed.notify_all()
+
+    def encoded(self, symbol=None, interval=None):
+        """(etag, body) for the filtered signals, cached until the next publish"""
+        key = (symbol, interval)
+        with self._changed:
+            cached = self._encoded.get(key)
+            if cached is not None:
+                return cached
+            signals = [
+                signal for (sig_symbol, sig_interval), signal in sorted(self._signals.items())
+                if (symbol is None or sig_symbol == symbol) and (interval is None or sig_interval == interval)
+            ]
+            body = json.dumps({'signals': signals}).encode()
+            etag = '"' + hashlib.blake2s(body, digest_size=8).hexdigest() + '"'
+            self._encoded[key] = (etag, body)
+            return etag, body
+
+    def wait_for_change(self, symbol, interval, etag, timeout):
+        """Block until the filtered answer no longer matches etag, or timeout"""
+        deadline = time.monotonic() + timeout
+        # Check and wait under one hold so a publish in between is not missed
+        with self._changed:
+            while True:
+                current = self.encoded(symbol, interval)
+                remaining = deadline - time.monotonic()
+                if current[0] != etag or remaining <= 0:
+                    return current
+                self._changed.wait(remaining)
+
+
+class SignalDaemon:
+    """Sweep the watchlist and publish to a SignalBoard
+
+    Sweeps run every `refresh` seconds, or with aligned=True right after each
+    interval's candle closes, batching intervals that close together.
+    """
+
+    def __init__(self, symbols, intervals, refresh=60, store=None, max_workers=16, aligned=False, rules=None):
+        self.symbols = list(symbols)
+        self.intervals = list(intervals)
+        self.refresh = refresh
+        self.store = store
+        self.max_workers = max_workers
+        self.aligned = aligned
+        self.rules = rules
+        self.board = SignalBoard()
+        self._stopped = threading.Event()
+
+    def sweep(self, intervals=None):
+        """Recompute every symbol for the given intervals"""
+        for interval in intervals or self.intervals:
+            scanner = SignalScanner(interval, max_workers=self.max_workers, store=self.store, rules=self.rules)
+            for signal in scanner.scan(self.symbols):
+                if signal['signal'] != 'ERROR':
+                    self.board.publish(interval, signal)
+        self.board.swept_at = time.time()
+
+    def run(self):
+        """Sweep until stop() is called"""
+        if self.aligned:
+            return self._run_aligned()
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Sweep failed: {e}")
+            self._stopped.wait(max(0.0, self.refresh - (time.monotonic() - started)))
+
+    def _run_aligned(self):
+        schedule = RefreshSchedule()
+        for interval in self.intervals:
+            schedule.watch('*', interval)
+        due = self.intervals
+        while not self._stopped.is_set():
+            if due:
+                try:
+                    self.sweep(due)
+                except Exception as e:
+                    print(f"Sweep failed: {e}")
+            self._stopped.wait(schedule.delay())
+            due = [interval for _, interval in schedule.pop_due()]
+
+    def start(self):
+        threading.Thread(target=self.run, name='signal-daemon', daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+
+def make_handler(board):
+    """Request handler class serving board"""
+
+    class SignalHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+            if url.path == '/health':
+                self._send(200, json.dumps({
+                    'status': 'ok',
+                    'version': board.version,
+                    'updated_at': board.updated_at,
+                    'swept_at': board.swept_at,
+                    'rate_limit': get_governor().stats()
+                }).encode())
+                return
+            if url.path != '/signals':
+                self._send(404, b'{"error": "not found"}')
+                return
+
+            symbol = query.get('symbol', '').upper() or None
+            interval = query.get('interval') or None
+            client_etag = self.headers.get('If-None-Match')
+            try:
+                wait = min(float(query.get('wait', 0)), MAX_WAIT)
+            except ValueError:
+                self._send(400, b'{"error": "wait must be a number"}')
+                return
+
+            if wait > 0 and client_etag:
+                etag, body = board.wait_for_change(symbol, interval, client_etag, wait)
+            else:
+                etag, body = board.encoded(symbol, interval)
+
+            if client_etag == etag:
+                self._send(304, b'', etag)
+            else:
+                self._send(200, body, etag)
+
+        def _send(self, status, body, etag=None):
+            self.send_response(status)
+            if etag is not None:
+                self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            if status != 304:
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SignalHandler
+
+
+def serve(daemon, host='127.0.0.1', port=8765):
+    """HTTP server for the daemon's board; call serve_forever() on it"""
+    server = ThreadingHTTPServer((host, port), make_handler(daemon.board))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve trading signals for a watchlist over HTTP")
+    parser.add_argument('--symbols', default='BTCUSDT,ETHUSDT,SOLUSDT,ADAUSDT',
+                        help="comma separated symbols, or 'USDT' for every trading USDT pair")
+    parser.add_argument('--intervals', default='1h', help="comma separated kline intervals")
+    parser.add_argument('--refresh', type=float, default=60, help="seconds between sweeps")
+    parser.add_argument('--on-close', action='store_true',
+                        help="sweep each interval right after its candle closes instead of every --refresh seconds")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--db', help="candle store path (enables incremental fetches)")
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--rules', help="JSON or YAML rule set replacing the built-in signal rules")
+    args = parser.parse_args(argv)
+
+    if args.symbols.upper() == 'USDT':
+        symbols = SignalScanner().usdt_symbols()
+    else:
+        symbols = [symbol.strip().upper() for symbol in args.symbols.split(',') if symbol.strip()]
+    intervals = [interval.strip() for interval in args.intervals.split(',') if interval.strip()]
+    store = CandleStore(args.db) if args.db else None
+    rules = load_rules(args.rules) if args.rules else None
+
+    daemon = SignalDaemon(symbols, intervals, refresh=args.refresh, store=store,
+                          max_workers=args.workers, aligned=args.on_close, rules=rules).start()
+    server = serve(daemon, args.host, args.port)
+    print(f"Serving {len(symbols)} symbols x {len(intervals)} intervals on http://{args.host}:{args.port}/signals")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        server.server_close()
+        if store is not None:
+            store.close()
+
+
+if __name__ == '__main__':
+    main()
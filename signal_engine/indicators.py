@@ -0,0 +1,160 @@
+"""
+Vectorized indicators
+Full RSI / SMA / EMA series over a CandleSeries or array of closes
+
+Every function returns an array aligned with the input closes, with NaN
+for the warm-up bars where the indicator is not defined yet.
+"""
+
+import math
+
+import numpy as np
+
+
+# Largest power of ten a smoothing block may scale values by before it restarts
+_MAX_BLOCK_EXPONENT = 150 * math.log(10)
+
+
+def _closes(values):
+    """Close prices from a CandleSeries or any array-like"""
+    closes = getattr(values, 'close', values)
+    return np.asarray(closes, dtype=np.float64)
+
+
+def _rolling_sum(values, period):
+    """Sum of each full window of `period` values"""
+    return np.convolve(values, np.ones(period), mode='valid')
+
+
+def _smooth(values, alpha, seed):
+    """Evaluate y[i] = (1 - alpha) * y[i-1] + alpha * values[i] starting from seed
+
+    The recurrence is unrolled into a cumulative sum of values scaled by
+    powers of the decay, split into blocks so the scale factor never
+    overflows.
+    """
+    out = np.empty(len(values))
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = values
+        return out
+
+    block = max(1, int(_MAX_BLOCK_EXPONENT / -math.log(decay)))
+    prev = seed
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(len(chunk))
+        smoothed = decay * powers * prev + alpha * powers * np.cumsum(chunk / powers)
+        out[start:start + len(chunk)] = smoothed
+        prev = smoothed[-1]
+    return out
+
+
+def sma(values, period):
+    """Simple moving average"""
+    closes = _closes(values)
+    out = np.full(len(closes), np.nan)
+    if period > 0 and len(closes) >= period:
+        out[period - 1:] = _rolling_sum(closes, period) / period
+    return out
+
+
+def ema(values, period):
+    """Exponential moving average seeded with the SMA of the first `period` closes"""
+    closes = _closes(values)
+    out = np.full(len(closes), np.nan)
+    if period > 0 and len(closes) >= period:
+        seed = closes[:period].sum() / period
+        out[period - 1] = seed
+        out[period:] = _smooth(closes[period:], 2.0 / (period + 1), seed)
+    return out
+
+
+def rsi(values, period=14, wilder=False):
+    """Relative Strength Index
+
+    By default gains and losses are plain averages over the last `period`
+    deltas, matching TradingSignal.calculate_rsi. With wilder=True they
+    use Wilder's smoothing instead: seeded with the first `period` deltas,
+    then avg = (prev * (period - 1) + current) / period.
+    """
+    closes = _closes(values)
+    out = np.full(len(closes), np.nan)
+    if period <= 0 or len(closes) < period + 1:
+        return out
+
+    deltas = np.diff(closes)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+
+    if wilder:
+        avg_gain = np.empty(len(deltas) - period + 1)
+        avg_loss = np.empty(len(deltas) - period + 1)
+        avg_gain[0] = gains[:period].sum() / period
+        avg_loss[0] = losses[:period].sum() / period
+        avg_gain[1:] = _smooth(gains[period:], 1.0 / period, avg_gain[0])
+        avg_loss[1:] = _smooth(losses[period:], 1.0 / period, avg_loss[0])
+    else:
+        avg_gain = _rolling_sum(gains, period) / period
+        avg_loss = _rolling_sum(losses, period) / period
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values_rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    out[period:] = np.where(avg_loss == 0, 100.0, values_rsi)
+    return out
+
+
+def compute_indicators(series, rsi_period=14, sma_periods=(20, 50), ema_periods=(), wilder=False):
+    """Compute every indicator the signal card and charts use in one call
+
+    Returns a dict of full-length arrays keyed 'rsi', 'sma_<n>' and 'ema_<n>'.
+    """
+    closes = _closes(series)
+    result = {'rsi': rsi(closes, rsi_period, wilder=wilder)}
+    for period in sma_periods:
+        result[f'sma_{period}'] = sma(closes, period)
+    for period in ema_periods:
+        result[f'ema_{period}'] = ema(closes, period)
+    return result
+
+
+class IndicatorCache:
+    """Full-length indicator series memoised per dataset and period
+
+    Indicators only look back, so a series computed once over the whole
+    history can be sliced for any sub-window (folds, train/test splits)
+    instead of being recomputed for it.
+    """
+
+    def __init__(self):
+        self._closes = {}
+        self._series = {}
+
+    def add(self, key, values):
+        """Register a dataset's closes under key"""
+        self._closes[key] = _closes(values)
+        self._series = {name: series for name, series in self._series.items() if name[0] != key}
+
+    def keys(self):
+        return list(self._closes)
+
+    def closes(self, key):
+        return self._closes[key]
+
+    def rsi(self, key, period=14, wilder=False):
+        cache_key = (key, 'rsi', period, wilder)
+        if cache_key not in self._series:
+            self._series[cache_key] = rsi(self._closes[key], period, wilder=wilder)
+        return self._series[cache_key]
+
+    def sma(self, key, period):
+        cache_key = (key, 'sma', period)
+        if cache_key not in self._series:
+            self._series[cache_key] = sma(self._closes[key], period)
+        return self._series[cache_key]
+
+    def ema(self, key, period):
+        cache_key = (key, 'ema', period)
+        if cache_key not in self._series:
+            self._series[cache_key] = ema(self._closes[key], period)
+        return self._series[cache_key]
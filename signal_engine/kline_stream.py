@@ -0,0 +1,149 @@
+"""
+Live kline stream
+WebSocket kline feed driving StreamingSignal, with REST fallback
+
+Uses the optional websocket-client package. Without it, or while the
+socket keeps failing, the stream polls the REST klines endpoint instead.
+"""
+
+import importlib.util
+import random
+import threading
+
+from .candles import CandleSeries
+from .klines_decode import json_loads
+from .strategy import mark_stale
+from .streaming import StreamingSignal
+
+
+STREAM_URL = "wss://stream.binance.com:9443/ws"
+
+
+def stream_available():
+    """Whether the optional websocket-client dependency is installed"""
+    return importlib.util.find_spec('websocket') is not None
+
+
+class KlineStream:
+    """Keep a StreamingSignal current from the exchange kline stream
+
+    rest_fetch() must return (prices, stale): a CandleSeries of recent
+    candles and whether they are fallback data kept while the exchange was
+    unreachable. It seeds the indicators on every (re)connect and serves
+    updates while the socket is down. Signals are marked stale until a
+    fresh reseed. on_signal(signal) is called from the stream thread.
+    """
+
+    def __init__(self, symbol, interval, on_signal, rest_fetch, url=STREAM_URL, store=None,
+                 wilder=False, min_backoff=1.0, max_backoff=60.0, fallback_after=3, poll_interval=300):
+        self.symbol = symbol
+        self.interval = interval
+        self.on_signal = on_signal
+        self.rest_fetch = rest_fetch
+        self.url = f"{url.rstrip('/')}/{symbol.lower()}@kline_{interval}"
+        self.store = store
+        self.wilder = wilder
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.fallback_after = fallback_after
+        self.poll_interval = poll_interval
+
+        self.state = None
+        self.stale = False
+        self.failures = 0
+        self._socket = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start streaming on a daemon thread"""
+        self._thread = threading.Thread(target=self._run, name=f"kline-{self.symbol}-{self.interval}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop streaming and close the socket"""
+        self._stopped.set()
+        socket = self._socket
+        if socket is not None:
+            try:
+                socket.close()
+            except Exception:
+                pass
+
+    def _run(self):
+        if not stream_available():
+            self._poll_forever()
+            return
+
+        import websocket
+
+        while not self._stopped.is_set():
+            try:
+                self._socket = websocket.create_connection(self.url, timeout=30)
+                self._reseed()
+                self.failures = 0
+                while not self._stopped.is_set():
+                    message = self._socket.recv()
+                    if message:
+                        self.handle_message(message)
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                self.failures += 1
+                print(f"Kline stream error ({self.failures}): {e}")
+                if self.failures >= self.fallback_after:
+                    self._reseed()
+                self._stopped.wait(self._backoff())
+            finally:
+                if self._socket is not None:
+                    try:
+                        self._socket.close()
+                    except Exception:
+                        pass
+                    self._socket = None
+
+    def _poll_forever(self):
+        """REST-only mode when no WebSocket client is installed"""
+        while not self._stopped.is_set():
+            self._reseed()
+            self._stopped.wait(self.poll_interval)
+
+    def _backoff(self):
+        """Exponential backoff with jitter for the next reconnect"""
+        delay = min(self.max_backoff, self.min_backoff * 2 ** (self.failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _reseed(self):
+        """Rebuild indicator state from REST so candles missed while offline count"""
+        prices, stale = self.rest_fetch()
+        if not len(prices):
+            return
+        state = StreamingSignal(self.symbol, wilder=self.wilder)
+        state.seed(prices)
+        self.state = state
+        self.stale = stale
+        self.on_signal(self._signal())
+
+    def _signal(self):
+        """Current signal, flagged while the seed came from fallback candles"""
+        signal = self.state.signal()
+        if self.stale and signal['signal'] != 'ERROR':
+            mark_stale(signal, self.state.last_timestamp)
+        return signal
+
+    def handle_message(self, message):
+        """Apply one kline stream message"""
+        data = json_loads(message)
+        data = data.get('data', data)
+        kline = data.get('k')
+        if kline is None or self.state is None:
+            return
+
+        self.state.on_candle(kline['t'], float(kline['c']))
+        if kline.get('x') and self.store is not None:
+            self.store.merge(self.symbol, self.interval, CandleSeries.from_rows([(
+                kline['t'], float(kline['o']), float(kline['h']),
+                float(kline['l']), float(kline['c']), float(kline['v'])
+            )]))
+        self.on_signal(self._signal())
@@ -0,0 +1,83 @@
+"""
+Klines decoder
+Parse raw klines response bytes straight into a CandleSeries
+
+With orjson installed, bodies are parsed by orjson, which beats any
+Python-level parsing. Otherwise Binance's layout (every candle a flat
+12-field array of numbers and numeric strings) takes a fast path: strip
+the brackets and quotes, split once on commas and convert only the six
+columns we keep. Payloads of any other shape go through stdlib json.
+"""
+
+import json
+
+import numpy as np
+
+from .candles import CandleSeries
+
+_orjson = None
+
+
+FIELDS_PER_CANDLE = 12
+
+_STRIP = b'[]"'
+
+
+def json_backend():
+    """orjson when installed, the stdlib json module otherwise"""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = json
+    return _orjson
+
+
+def json_loads(raw):
+    """Decode JSON bytes with the fastest available backend"""
+    return json_backend().loads(raw)
+
+
+def _decode_flat(raw):
+    """Fast path: CandleSeries from the canonical flat klines layout, or None"""
+    candles = raw.count(b'[') - 1
+    if candles <= 0:
+        return CandleSeries.empty() if raw.strip() == b'[]' else None
+
+    fields = raw.translate(None, _STRIP).split(b',')
+    if len(fields) != candles * FIELDS_PER_CANDLE:
+        return None
+
+    return CandleSeries(
+        np.array(list(map(int, fields[0::FIELDS_PER_CANDLE])), dtype=np.int64),
+        *(
+            np.array(list(map(float, fields[column::FIELDS_PER_CANDLE])), dtype=np.float64)
+            for column in range(1, 6)
+        )
+    )
+
+
+def decode_klines(raw):
+    """Decode a klines response body into a CandleSeries
+
+    Raises ValueError for exchange error payloads such as
+    {"code": -1121, "msg": "Invalid symbol."}.
+    """
+    if isinstance(raw, str):
+        raw = raw.encode()
+    raw = raw.strip()
+
+    # The split path only pays off against the stdlib json module
+    if raw[:1] == b'[' and json_backend() is json:
+        try:
+            prices = _decode_flat(raw)
+        except ValueError:
+            prices = None
+        if prices is not None:
+            return prices
+
+    data = json_loads(raw)
+    if isinstance(data, dict):
+        raise ValueError(f"Binance error {data.get('code')}: {data.get('msg')}")
+    return CandleSeries.from_klines(data)
@@ -0,0 +1,166 @@
+"""
+Parameter sweep optimizer
+Grid or random search over the signal thresholds on a process pool
+
+Candle closes for every (symbol, interval) dataset are copied once into a
+shared memory block that worker processes map read-only, so tasks only
+carry a parameter dict. Each parameter set is scored on the first
+train_fraction of every dataset and reported out-of-sample on the rest.
+"""
+
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import backtest, indicators, strategy
+
+
+PARAM_GRID = {
+    'rsi_period': [7, 14, 21],
+    'sma_fast': [10, 20, 30],
+    'sma_slow': [50, 100, 200],
+    'oversold': [20, 25, 30, 35],
+    'overbought': [65, 70, 75, 80]
+}
+
+METRICS = ('total_return', 'max_drawdown', 'win_rate', 'trade_count')
+
+
+def _valid(params):
+    return params['sma_fast'] < params['sma_slow'] and params['oversold'] < params['overbought']
+
+
+def grid(param_grid=PARAM_GRID):
+    """Every valid combination of the grid values"""
+    names = list(param_grid)
+    combos = (dict(zip(names, values)) for values in itertools.product(*param_grid.values()))
+    return [params for params in combos if _valid(params)]
+
+
+def random_search(param_grid=PARAM_GRID, samples=100, seed=None):
+    """`samples` distinct valid combinations drawn at random from the grid"""
+    combos = grid(param_grid)
+    return random.Random(seed).sample(combos, min(samples, len(combos)))
+
+
+class SharedCloses:
+    """Close arrays for several datasets packed into one shared memory block"""
+
+    def __init__(self, datasets):
+        arrays = {
+            key: np.asarray(getattr(prices, 'close', prices), dtype=np.float64)
+            for key, prices in datasets.items()
+        }
+        self.layout = {}
+        offset = 0
+        for key, closes in arrays.items():
+            self.layout[key] = (offset, len(closes))
+            offset += closes.nbytes
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for key, closes in arrays.items():
+            start, length = self.layout[key]
+            np.ndarray(length, dtype=np.float64, buffer=self.shm.buf, offset=start)[:] = closes
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Release and remove the shared block"""
+        self.shm.close()
+        self.shm.unlink()
+
+
+# Worker process state, set up once per process by _init_worker
+_shm = None
+_cache = indicators.IndicatorCache()
+
+
+def _init_worker(name, layout):
+    global _shm
+    try:
+        _shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # track= is Python 3.13+; older workers share the parent's resource tracker
+        _shm = shared_memory.SharedMemory(name=name)
+    for key, (offset, length) in layout.items():
+        view = np.ndarray(length, dtype=np.float64, buffer=_shm.buf, offset=offset)
+        view.flags.writeable = False
+        _cache.add(key, view)
+
+
+def summary(result):
+    """Scalar metrics of a backtest result"""
+    return {metric: result[metric] for metric in METRICS}
+
+
+def _evaluate(task):
+    """Score one parameter set on every dataset's train and test split"""
+    params, train_fraction, fee = task
+    per_dataset = {}
+    for key in _cache.keys():
+        closes = _cache.closes(key)
+        votes = strategy.vote_series(
+            _cache.rsi(key, params['rsi_period']),
+            _cache.sma(key, params['sma_fast']),
+            _cache.sma(key, params['sma_slow']),
+            params['oversold'],
+            params['overbought']
+        )
+        # Indicators only look back, so the test split keeps its warm-up from the train bars
+        cut = int(len(closes) * train_fraction)
+        per_dataset[key] = {
+            'train': summary(backtest.backtest_votes(closes[:cut], votes[:cut], fee=fee)),
+            'test': summary(backtest.backtest_votes(closes[cut:], votes[cut:], fee=fee))
+        }
+    return params, per_dataset
+
+
+def _mean(per_dataset, split):
+    return {
+        metric: float(np.mean([scores[split][metric] for scores in per_dataset.values()]))
+        for metric in METRICS
+    }
+
+
+def optimize(datasets, candidates=None, train_fraction=0.7, fee=0.001,
+             metric='total_return', max_workers=None):
+    """Rank parameter sets by their mean in-sample metric across datasets
+
+    datasets maps a key such as (symbol, interval) to a CandleSeries or
+    array of closes. candidates defaults to the full grid(). Returns a list
+    of dicts with 'params', mean 'train' and 'test' metrics and the
+    'per_dataset' breakdown, best first.
+    """
+    candidates = grid() if candidates is None else candidates
+    max_workers = max_workers or os.cpu_count() or 1
+    shared = SharedCloses(datasets)
+    try:
+        tasks = [(params, train_fraction, fee) for params in candidates]
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(shared.name, shared.layout)
+        ) as pool:
+            evaluated = list(pool.map(_evaluate, tasks, chunksize=chunksize))
+    finally:
+        shared.close()
+
+    results = [
+        {
+            'params': params,
+            'train': _mean(per_dataset, 'train'),
+            'test': _mean(per_dataset, 'test'),
+            'per_dataset': per_dataset
+        }
+        for params, per_dataset in evaluated
+    ]
+    # Higher is better for every metric, max_drawdown included (it is <= 0)
+    results.sort(key=lambda result: result['train'][metric], reverse=True)
+    return results
@@ -0,0 +1,82 @@
+"""
+Timeframe resampling
+Aggregate fine candles into higher timeframes without another download
+"""
+
+import numpy as np
+
+from .candles import INTERVAL_MS, INTERVAL_OFFSET_MS, CandleSeries
+
+
+# Largest klines page, and the candles the signal rules need (SMA 50 + the open candle)
+PAGE_LIMIT = 1000
+CANDLES_NEEDED = 51
+
+
+def ratio(interval, target):
+    """How many `interval` candles make one `target` candle, or None if they don't nest"""
+    base_ms, target_ms = INTERVAL_MS.get(interval), INTERVAL_MS.get(target)
+    if base_ms is None or target_ms is None or target_ms <= base_ms or target_ms % base_ms:
+        return None
+    # Weekly buckets start on Monday, which only sub-day intervals line up with
+    if INTERVAL_OFFSET_MS.get(target, 0) % base_ms:
+        return None
+    return target_ms // base_ms
+
+
+def base_limit(interval, targets, needed=CANDLES_NEEDED):
+    """Base candles to download so every target gets `needed` candles, capped at one page"""
+    ratios = [ratio(interval, target) or 1 for target in targets]
+    # One extra bucket because the oldest one is usually incomplete and dropped
+    return min(PAGE_LIMIT, max([needed] + [(needed + 1) * r for r in ratios]))
+
+
+def reachable(interval, targets, needed=CANDLES_NEEDED):
+    """Targets that resample from `interval` with enough candles from one page"""
+    return [
+        target for target in targets
+        if ratio(interval, target) and (needed + 1) * ratio(interval, target) <= PAGE_LIMIT
+    ]
+
+
+def resample(prices, interval, target):
+    """Aggregate `interval` candles into `target` candles
+
+    Buckets follow the exchange's alignment (epoch multiples, Monday for
+    weeks). The oldest bucket is dropped when the download starts inside
+    it; the newest is the still-open candle, as the exchange reports it.
+    """
+    if ratio(interval, target) is None:
+        raise ValueError(f"{interval} candles do not resample into {target}")
+    if not len(prices):
+        return CandleSeries.empty()
+
+    target_ms = INTERVAL_MS[target]
+    offset = INTERVAL_OFFSET_MS.get(target, 0)
+    buckets = (prices.timestamp - offset) // target_ms
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [len(buckets)])) - 1
+
+    opened = buckets[starts] * target_ms + offset
+    if prices.timestamp[0] != opened[0]:
+        starts, ends, opened = starts[1:], ends[1:], opened[1:]
+        if not len(starts):
+            return CandleSeries.empty()
+
+    return CandleSeries(
+        opened,
+        prices.open[starts],
+        np.maximum.reduceat(prices.high, starts),
+        np.minimum.reduceat(prices.low, starts),
+        prices.close[ends],
+        np.add.reduceat(prices.volume, starts)
+    )
+
+
+def resample_many(prices, interval, targets):
+    """{target: CandleSeries} for each target, plus `interval` itself"""
+    frames = {interval: prices}
+    for target in targets:
+        if target != interval:
+            frames[target] = resample(prices, interval, target)
+    return frames
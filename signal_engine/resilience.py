@@ -0,0 +1,367 @@
+"""
+Resilient fetching
+Retries, hedged requests and a circuit breaker around a transport
+"""
+
+import random
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import urlsplit
+
+
+class TransientError(Exception):
+    """A response worth retrying, such as HTTP 5xx"""
+
+
+class CircuitOpen(Exception):
+    """Requests to a host are suspended after repeated failures"""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"circuit open for {host}, retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def is_transient(error):
+    """Whether a failed request may succeed if simply tried again
+
+    Timeouts, dropped connections, DNS failures and 5xx are transient;
+    4xx, rate limiting and bad payloads are not.
+    """
+    if isinstance(error, (TransientError, TimeoutError, ConnectionError, socket.gaierror)):
+        return True
+    requests = sys.modules.get('requests')
+    if requests is not None and isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    aiohttp = sys.modules.get('aiohttp')
+    if aiohttp is not None:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500
+        if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError)):
+            return True
+    asyncio = sys.modules.get('asyncio')
+    return asyncio is not None and isinstance(error, asyncio.TimeoutError)
+
+
+class LatencyTracker:
+    """Recent successful request latencies"""
+
+    def __init__(self, size=256):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q):
+        """q-th quantile (0 to 1) of recent latencies, or None without samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def __len__(self):
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """Open after `threshold` consecutive failures, probe again after `reset_timeout`
+
+    While open every call is refused at once. After reset_timeout one probe
+    is let through; its success closes the circuit, its failure re-opens it.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._probing or self.clock() - self._opened_at >= self.reset_timeout:
+                return 'half_open'
+            return 'open'
+
+    def allow(self):
+        """Whether a request may go out now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self.clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def retry_in(self):
+        """Seconds until the next probe is allowed"""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self.clock() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = self.clock()
+                self._probing = False
+
+    def release(self):
+        """Give up a probe that ended without a verdict, letting the next call probe"""
+        with self._lock:
+            self._probing = False
+
+
+# Threads running hedged duplicates; the slower copy finishes in the background
+_hedge_pool = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _get_hedge_pool():
+    global _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedge')
+        return _hedge_pool
+
+
+class ResilientTransport:
+    """Wrap a transport with classified retries, hedging and a circuit breaker
+
+    Transient failures are retried up to `retries` times with full-jitter
+    exponential backoff (base_delay * 2**attempt, capped at max_delay).
+    With hedge=True, once `min_samples` latencies are known a duplicate
+    request is sent when the first one is slower than the hedge_quantile
+    latency, and the first answer wins. Each host has its own
+    CircuitBreaker; while it is open get() raises CircuitOpen immediately.
+    A non-transient answer (4xx, rate limiting) proves the host reachable
+    and closes it; a cancelled probe leaves the next call to probe again.
+
+    Wraps HttpTransport (get) or AsyncHttpTransport (get_bytes); with no
+    transport the process-wide one is looked up on every call.
+    """
+
+    def __init__(self, transport=None, retries=3, base_delay=0.25, max_delay=4.0, hedge=True,
+                 hedge_quantile=0.9, min_samples=20, breaker_threshold=5, breaker_reset=30.0):
+        self._transport = transport
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.min_samples = min_samples
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.latency = LatencyTracker()
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._retried = 0
+        self._hedged = 0
+
+    @property
+    def transport(self):
+        if self._transport is not None:
+            return self._transport
+        from .transport import get_transport
+
+        return get_transport()
+
+    def breaker(self, url):
+        """Circuit breaker for the host serving url"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            return self._breakers[host]
+
+    def backoff(self, attempt):
+        """Full-jitter delay before retry number attempt + 1"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def hedge_delay(self):
+        """Seconds to wait before sending a duplicate, or None when not hedging"""
+        if not self.hedge or len(self.latency) < self.min_samples:
+            return None
+        return self.latency.percentile(self.hedge_quantile)
+
+    def _check(self, url, breaker):
+        if not breaker.allow():
+            raise CircuitOpen(urlsplit(url).netloc, breaker.retry_in())
+
+    def _failed(self, error, attempt, breaker):
+        """Record a failure; return the backoff before retrying or re-raise"""
+        if not is_transient(error):
+            # The host answered, so it is up even though the request failed
+            breaker.record_success()
+            raise error
+        breaker.record_failure()
+        if attempt >= self.retries or not breaker.allow():
+            raise error
+        with self._lock:
+            self._retried += 1
+        return self.backoff(attempt)
+
+    def get(self, url, params=None, **kwargs):
+        """GET through the wrapped transport, returning its response"""
+        breaker = self.breaker(url)
+        self._check(url, breaker)
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = self._hedged_get(url, params, kwargs)
+                except Exception as e:
+                    time.sleep(self._failed(e, attempt, breaker))
+                    continue
+                breaker.record_success()
+                return response
+        finally:
+            # No-op after a verdict; frees a probe interrupted by anything else
+            breaker.release()
+
+    def _timed_get(self, url, params, kwargs):
+        started = time.monotonic()
+        response = self.transport.get(url, params=params, **kwargs)
+        if response.status_code >= 500:
+            raise TransientError(f"HTTP {response.status_code} from {urlsplit(url).netloc}")
+        self.latency.add(time.monotonic() - started)
+        return response
+
+    def _hedged_get(self, url, params, kwargs):
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed_get(url, params, kwargs)
+
+        pool = _get_hedge_pool()
+        primary = pool.submit(self._timed_get, url, params, kwargs)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+
+        with self._lock:
+            self._hedged += 1
+        duplicate = pool.submit(self._timed_get, url, params, kwargs)
+        error = None
+        for future in as_completed([primary, duplicate]):
+            try:
+                return future.result()
+            except Exception as e:
+                error = e
+        raise error
+
+    async def get_bytes(self, url, params=None, **kwargs):
+        """Async GET through the wrapped transport, returning the body"""
+        import asyncio
+
+        breaker = self.breaker(url)
+        self._check(url, breaker)
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    body = await self._hedged_get_bytes(url, params, kwargs)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    await asyncio.sleep(self._failed(e, attempt, breaker))
+                    continue
+                breaker.record_success()
+                return body
+        finally:
+            breaker.release()
+
+    async def _timed_get_bytes(self, url, params, kwargs):
+        started = time.monotonic()
+        body = await self.transport.get_bytes(url, params=params, **kwargs)
+        self.latency.add(time.monotonic() - started)
+        return body
+
+    async def _hedged_get_bytes(self, url, params, kwargs):
+        import asyncio
+
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._timed_get_bytes(url, params, kwargs)
+
+        primary = asyncio.ensure_future(self._timed_get_bytes(url, params, kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        with self._lock:
+            self._hedged += 1
+        pending = {primary, asyncio.ensure_future(self._timed_get_bytes(url, params, kwargs))}
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    def stats(self):
+        """Retry, hedge, latency and breaker metrics"""
+        with self._lock:
+            breakers = dict(self._breakers)
+            retried, hedged = self._retried, self._hedged
+        return {
+            'retries': retried,
+            'hedged': hedged,
+            'p50_latency': self.latency.percentile(0.5),
+            'p95_latency': self.latency.percentile(0.95),
+            'breakers': {host: breaker.state for host, breaker in breakers.items()}
+        }
+
+
+class AsyncResilientTransport(ResilientTransport):
+    """ResilientTransport defaulting to the process-wide async transport"""
+
+    @property
+    def transport(self):
+        if self._transport is not None:
+            return self._transport
+        from .transport import get_async_transport
+
+        return get_async_transport()
+
+
+_resilient = None
+_async_resilient = None
+_resilient_lock = threading.Lock()
+
+
+def get_resilient_transport():
+    """Process-wide ResilientTransport over get_transport()"""
+    global _resilient
+    with _resilient_lock:
+        if _resilient is None:
+            _resilient = ResilientTransport()
+        return _resilient
+
+
+def get_async_resilient_transport():
+    """Process-wide ResilientTransport over get_async_transport()"""
+    global _async_resilient
+    with _resilient_lock:
+        if _async_resilient is None:
+            _async_resilient = AsyncResilientTransport()
+        return _async_resilient
@@ -0,0 +1,254 @@
+"""
+Declarative signal rules
+JSON/YAML rule sets compiled into vectorized NumPy predicates
+
+A rule set looks like:
+
+    {
+        "buy_threshold": 2,
+        "sell_threshold": 2,
+        "rules": [
+            {"name": "RSI oversold", "when": "rsi < 30", "vote": "buy"},
+            {"name": "Trend up", "when": ["sma_20 > sma_50", "close > ema_200"],
+             "vote": "buy", "weight": 1.5}
+        ]
+    }
+
+A condition is "<left> <op> <right>" where each side is a number or one of
+open, high, low, close, volume, rsi, rsi_<n>, sma_<n> and ema_<n>, and op
+is one of < <= > >= == != crosses_above crosses_below. A list of
+conditions must all hold. When the weights of the firing buy rules reach
+buy_threshold the bar is a BUY, otherwise when sell rules reach
+sell_threshold it is a SELL.
+
+Indicators warming up take the values generate_signal falls back to on
+short windows (RSI 50, everything else 0), as in strategy.vote_series.
+"""
+
+import json
+import re
+
+import numpy as np
+
+from . import indicators, strategy
+
+
+OPERATORS = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '==': np.equal,
+    '!=': np.not_equal
+}
+CROSSES = ('crosses_above', 'crosses_below')
+
+_CONDITION = re.compile(r'^\s*(\S+)\s+(<=|>=|==|!=|<|>|crosses_above|crosses_below)\s+(\S+)\s*$')
+_INDICATOR = re.compile(r'^(open|high|low|close|volume|rsi|(?:rsi|sma|ema)_\d+)$')
+
+RECOMMENDATIONS = {
+    'BUY': "Strong BUY signal detected",
+    'SELL': "Strong SELL signal detected",
+    'HOLD': "No clear signal - HOLD position"
+}
+
+# The rules generate_signal has always applied
+DEFAULT_RULES = {
+    'name': 'default',
+    'buy_threshold': 2,
+    'sell_threshold': 2,
+    'rules': [
+        {'name': 'RSI oversold', 'when': f'rsi < {strategy.RSI_OVERSOLD}', 'vote': 'buy'},
+        {'name': 'RSI overbought', 'when': f'rsi > {strategy.RSI_OVERBOUGHT}', 'vote': 'sell'},
+        {'name': 'SMA 20 above SMA 50', 'when': 'sma_20 > sma_50', 'vote': 'buy'},
+        {'name': 'SMA 20 below SMA 50', 'when': 'sma_20 < sma_50', 'vote': 'sell'}
+    ]
+}
+
+
+def _operand(token):
+    """A float constant or a validated indicator name"""
+    try:
+        return float(token)
+    except ValueError:
+        pass
+    if not _INDICATOR.match(token):
+        raise ValueError(f"Unknown indicator {token!r}")
+    return 'rsi_14' if token == 'rsi' else token
+
+
+def parse_condition(text):
+    """(left, op, right) for a condition string"""
+    match = _CONDITION.match(text)
+    if match is None:
+        raise ValueError(f"Cannot parse condition {text!r}")
+    left, op, right = match.groups()
+    return _operand(left), op, _operand(right)
+
+
+def indicator_series(name, prices):
+    """Full-length series for an operand name over a CandleSeries or closes"""
+    if name in ('open', 'high', 'low', 'volume'):
+        if not hasattr(prices, name):
+            raise ValueError(f"{name} needs a CandleSeries, not bare closes")
+        return getattr(prices, name)
+    closes = np.asarray(getattr(prices, 'close', prices), dtype=np.float64)
+    if name == 'close':
+        return closes
+    kind, period = name.split('_')
+    series = getattr(indicators, kind)(closes, int(period))
+    return np.nan_to_num(series, nan=50.0 if kind == 'rsi' else 0.0)
+
+
+class RuleSet:
+    """Rules compiled once into operand, comparison and incidence arrays
+
+    Evaluation computes each distinct indicator once, runs one NumPy call
+    per comparison operator over every condition using it, and resolves
+    every rule and both scores with matrix products, so adding rules adds
+    rows rather than Python-level work.
+    """
+
+    def __init__(self, rules, buy_threshold=2, sell_threshold=2, recommendations=None, name='rules'):
+        if not rules:
+            raise ValueError("A rule set needs at least one rule")
+        self.name = name
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self.recommendations = dict(RECOMMENDATIONS, **(recommendations or {}))
+        self.rules = [self._parse_rule(rule) for rule in rules]
+        self._compile()
+
+    @staticmethod
+    def _parse_rule(rule):
+        when = rule['when']
+        conditions = [when] if isinstance(when, str) else list(when)
+        if not conditions:
+            raise ValueError(f"Rule {rule.get('name')!r} has no conditions")
+        vote = rule.get('vote', '').lower()
+        if vote not in ('buy', 'sell'):
+            raise ValueError(f"Rule {rule.get('name')!r} must vote 'buy' or 'sell'")
+        return {
+            'name': rule.get('name', ' and '.join(conditions)),
+            'conditions': [parse_condition(condition) for condition in conditions],
+            'side': 1 if vote == 'buy' else -1,
+            'weight': float(rule.get('weight', 1))
+        }
+
+    def _compile(self):
+        operands, comparisons = [], []
+        for rule in self.rules:
+            for left, op, right in rule['conditions']:
+                for operand in (left, right):
+                    if operand not in operands:
+                        operands.append(operand)
+                comparison = (operands.index(left), op, operands.index(right))
+                if comparison not in comparisons:
+                    comparisons.append(comparison)
+        self.operands = operands
+        self.comparisons = comparisons
+
+        # Comparison indices grouped by operator: one vectorized call per group
+        self._groups = {}
+        for index, (left, op, right) in enumerate(comparisons):
+            group = self._groups.setdefault(op, ([], [], []))
+            group[0].append(index)
+            group[1].append(left)
+            group[2].append(right)
+        self._groups = {op: tuple(np.array(part) for part in group) for op, group in self._groups.items()}
+
+        # incidence[r, c] is 1 when condition set r requires comparison c; rules
+        # sharing a condition set share a row and their weights add up
+        condition_sets = {}
+        for rule in self.rules:
+            required = frozenset(
+                comparisons.index((operands.index(left), op, operands.index(right)))
+                for left, op, right in rule['conditions']
+            )
+            weights = condition_sets.setdefault(required, [0.0, 0.0])
+            weights[0 if rule['side'] > 0 else 1] += rule['weight']
+        self._incidence = np.zeros((len(condition_sets), len(comparisons)), dtype=np.float32)
+        for row, required in enumerate(condition_sets):
+            self._incidence[row, list(required)] = 1
+        self._required = self._incidence.sum(axis=1)[:, None]
+        self._buy_weights = np.array([weights[0] for weights in condition_sets.values()])
+        self._sell_weights = np.array([weights[1] for weights in condition_sets.values()])
+        self._needs_previous = any(op in CROSSES for _, op, _ in comparisons)
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(
+            spec['rules'],
+            buy_threshold=spec.get('buy_threshold', 2),
+            sell_threshold=spec.get('sell_threshold', 2),
+            recommendations=spec.get('recommendations'),
+            name=spec.get('name', 'rules')
+        )
+
+    def _operand_matrix(self, prices, tail=None):
+        """(operands, bars) array, optionally only the last `tail` bars"""
+        length = len(getattr(prices, 'close', prices))
+        start = 0 if tail is None else max(0, length - tail)
+        matrix = np.empty((len(self.operands), length - start))
+        for row, operand in enumerate(self.operands):
+            if isinstance(operand, float):
+                matrix[row] = operand
+            else:
+                matrix[row] = indicator_series(operand, prices)[start:]
+        return matrix
+
+    def _scores(self, matrix):
+        """Buy and sell scores per bar from an operand matrix"""
+        bars = matrix.shape[1]
+        passed = np.zeros((len(self.comparisons), bars), dtype=bool)
+        for op, (index, left, right) in self._groups.items():
+            if op in CROSSES:
+                # True on the bar the relation starts holding after not holding
+                relation = (np.greater if op == 'crosses_above' else np.less)(matrix[left], matrix[right])
+                crossed = relation.copy()
+                crossed[:, 1:] &= ~relation[:, :-1]
+                crossed[:, 0] = False
+                passed[index] = crossed
+            else:
+                passed[index] = OPERATORS[op](matrix[left], matrix[right])
+        fired = ((self._incidence @ passed.astype(np.float32)) >= self._required).astype(np.float32)
+        return self._buy_weights @ fired, self._sell_weights @ fired
+
+    def evaluate(self, prices):
+        """Per-bar votes (+1 BUY, -1 SELL, 0 HOLD) and scores over a whole series"""
+        buy_score, sell_score = self._scores(self._operand_matrix(prices))
+        votes = np.zeros(len(buy_score), dtype=np.int8)
+        votes[sell_score >= self.sell_threshold] = -1
+        votes[buy_score >= self.buy_threshold] = 1
+        return {'votes': votes, 'buy_score': buy_score, 'sell_score': sell_score}
+
+    def latest(self, prices):
+        """(signal, strength, recommendation) for the newest bar only"""
+        buy_score, sell_score = self._scores(self._operand_matrix(prices, tail=2 if self._needs_previous else 1))
+        buy_score, sell_score = float(buy_score[-1]), float(sell_score[-1])
+        if buy_score >= self.buy_threshold:
+            signal, strength = 'BUY', buy_score
+        elif sell_score >= self.sell_threshold:
+            signal, strength = 'SELL', sell_score
+        else:
+            signal, strength = 'HOLD', 0
+        # Whole-number weights keep the integer strength the card displays
+        if float(strength).is_integer():
+            strength = int(strength)
+        return signal, strength, self.recommendations[signal]
+
+
+def load_rules(path):
+    """RuleSet from a .json, .yaml or .yml file (YAML needs PyYAML)"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if path.endswith(('.yaml', '.yml')):
+        import yaml
+
+        return RuleSet.from_dict(yaml.safe_load(text))
+    return RuleSet.from_dict(json.loads(text))
+
+
+def default_rules():
+    """RuleSet reproducing the built-in generate_signal rules"""
+    return RuleSet.from_dict(DEFAULT_RULES)
@@ -0,0 +1,100 @@
+"""
+Watchlist scanner
+Evaluate signals for many symbols with bounded concurrency
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from .client import AsyncTradingSignal, TradingSignal
+from .klines_decode import json_loads
+from .resilience import get_async_resilient_transport, get_resilient_transport
+from .transport import RateBudget
+
+
+class SignalScanner:
+    """Evaluate signals across a watchlist with bounded concurrency"""
+
+    EXCHANGE_INFO_URL = "https://api.binance.com/api/v3/exchangeInfo"
+
+    def __init__(self, interval="1h", max_workers=16, requests_per_second=20, transport=None, store=None,
+                 rules=None):
+        self.interval = interval
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.transport = transport or get_resilient_transport()
+        self.store = store
+        self.rules = rules
+        self._budgets = {}
+        self._budgets_lock = threading.Lock()
+
+    def _budget(self, url):
+        """Rate budget shared by every request to the host serving url"""
+        host = urlsplit(url).netloc
+        with self._budgets_lock:
+            if host not in self._budgets:
+                self._budgets[host] = RateBudget(self.requests_per_second)
+            return self._budgets[host]
+
+    def usdt_symbols(self):
+        """All USDT pairs currently trading on the exchange"""
+        self._budget(self.EXCHANGE_INFO_URL).acquire()
+        response = self.transport.get(self.EXCHANGE_INFO_URL, params={"permissions": "SPOT"})
+        return self._usdt_pairs(response.json())
+
+    async def usdt_symbols_async(self, transport=None):
+        """Async variant of usdt_symbols()"""
+        transport = transport or get_async_resilient_transport()
+        await self._budget(self.EXCHANGE_INFO_URL).acquire_async()
+        body = await transport.get_bytes(self.EXCHANGE_INFO_URL, params={"permissions": "SPOT"})
+        return self._usdt_pairs(json_loads(body))
+
+    @staticmethod
+    def _usdt_pairs(exchange_info):
+        return [
+            info['symbol']
+            for info in exchange_info['symbols']
+            if info['quoteAsset'] == 'USDT' and info['status'] == 'TRADING'
+        ]
+
+    def evaluate(self, symbol):
+        """Signal for a single symbol"""
+        self._budget(TradingSignal.BASE_URL).acquire()
+        trader = TradingSignal(symbol, transport=self.transport, store=self.store, rules=self.rules)
+        return trader.generate_signal(self.interval)
+
+    def scan(self, symbols):
+        """Yield each symbol's signal as soon as its fetch completes"""
+        if not symbols:
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols)))
+        try:
+            futures = [pool.submit(self.evaluate, symbol) for symbol in symbols]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Stop queued symbols if the caller abandons the scan early
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def scan_async(self, symbols, transport=None):
+        """Async variant of scan() multiplexing every fetch on one event loop"""
+        import asyncio
+
+        transport = transport or get_async_resilient_transport()
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def evaluate(symbol):
+            async with limit:
+                await self._budget(TradingSignal.BASE_URL).acquire_async()
+                trader = AsyncTradingSignal(symbol, transport=transport, store=self.store, rules=self.rules)
+                return await trader.generate_signal(self.interval)
+
+        tasks = [asyncio.ensure_future(evaluate(symbol)) for symbol in symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop pending fetches if the caller abandons or cancels the scan
+            for task in tasks:
+                task.cancel()
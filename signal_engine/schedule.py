@@ -0,0 +1,83 @@
+"""
+Refresh schedule
+Wake up just after candles close instead of polling on a fixed period
+"""
+
+import random
+import threading
+import time
+
+from .candles import INTERVAL_MS, candle_close_ms
+
+
+# Seconds between refreshes for intervals without a known candle length
+FALLBACK_PERIOD = 300
+
+
+class RefreshSchedule:
+    """Next candle close per watched (symbol, interval), batched into single wake-ups
+
+    Every pair whose candle has closed is returned by one pop_due() call, so
+    pairs on aligned intervals (5m, 15m and 1h all close on the hour) share
+    a wake-up. Wake-ups land `settle` seconds after the close plus up to
+    `jitter` seconds, so clients do not hit the exchange in the same instant
+    and the closed candle is already published.
+    """
+
+    def __init__(self, settle=1.0, jitter=4.0, clock=time.time):
+        self.settle = settle
+        self.jitter = jitter
+        self.clock = clock
+        self._next = {}
+        self._delay = self._draw_delay()
+        self._lock = threading.Lock()
+
+    def _draw_delay(self):
+        return self.settle + random.uniform(0, self.jitter)
+
+    def _close_after(self, interval, now):
+        if interval not in INTERVAL_MS:
+            return now + FALLBACK_PERIOD
+        return candle_close_ms(interval, int(now * 1000)) / 1000
+
+    def watch(self, symbol, interval):
+        """Start tracking a pair; its first wake-up is the current candle's close"""
+        with self._lock:
+            if (symbol, interval) not in self._next:
+                self._next[(symbol, interval)] = self._close_after(interval, self.clock())
+
+    def unwatch(self, symbol=None, interval=None):
+        """Stop tracking pairs matching symbol and/or interval (everything by default)"""
+        with self._lock:
+            for key in list(self._next):
+                if (symbol is None or key[0] == symbol) and (interval is None or key[1] == interval):
+                    del self._next[key]
+
+    def watched(self):
+        with self._lock:
+            return list(self._next)
+
+    def next_wakeup(self):
+        """Timestamp of the next wake-up, or None when nothing is watched"""
+        with self._lock:
+            if not self._next:
+                return None
+            return min(self._next.values()) + self._delay
+
+    def delay(self):
+        """Seconds until the next wake-up (never negative), or None"""
+        wakeup = self.next_wakeup()
+        if wakeup is None:
+            return None
+        return max(0.0, wakeup - self.clock())
+
+    def pop_due(self):
+        """Pairs whose candle has closed, each rescheduled for its next close"""
+        now = self.clock()
+        with self._lock:
+            due = sorted(key for key, close in self._next.items() if close <= now)
+            for key in due:
+                self._next[key] = self._close_after(key[1], now)
+            if due:
+                self._delay = self._draw_delay()
+        return due
@@ -0,0 +1,123 @@
+"""
+Signal rules
+RSI / SMA voting shared by every signal source
+"""
+
+from datetime import datetime
+
+
+RSI_OVERSOLD = 30
+RSI_OVERBOUGHT = 70
+
+
+def vote(rsi, sma_fast, sma_slow, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT):
+    """Return (signal, strength, recommendation) for one set of indicator values"""
+    buy_signals = 0
+    sell_signals = 0
+
+    if rsi < oversold:
+        buy_signals += 1
+    elif rsi > overbought:
+        sell_signals += 1
+
+    if sma_fast > sma_slow:
+        buy_signals += 1
+    elif sma_fast < sma_slow:
+        sell_signals += 1
+
+    if buy_signals >= 2:
+        return 'BUY', buy_signals, "Strong BUY signal detected"
+    if sell_signals >= 2:
+        return 'SELL', sell_signals, "Strong SELL signal detected"
+    return 'HOLD', 0, "No clear signal - HOLD position"
+
+
+def vote_series(rsi, sma_fast, sma_slow, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT):
+    """vote() over whole indicator arrays: +1 for BUY, -1 for SELL, 0 for HOLD
+
+    Warm-up NaNs take the values generate_signal falls back to on short
+    windows (RSI 50, SMA 0), so every bar matches a per-bar vote() call.
+    """
+    import numpy as np
+
+    rsi = np.nan_to_num(rsi, nan=50.0)
+    sma_fast = np.nan_to_num(sma_fast, nan=0.0)
+    sma_slow = np.nan_to_num(sma_slow, nan=0.0)
+
+    buy_signals = (rsi < oversold).astype(np.int8) + (sma_fast > sma_slow)
+    sell_signals = (rsi > overbought).astype(np.int8) + (sma_fast < sma_slow)
+
+    votes = np.zeros(len(rsi), dtype=np.int8)
+    votes[buy_signals >= 2] = 1
+    votes[sell_signals >= 2] = -1
+    return votes
+
+
+def build_signal(symbol, price, rsi, sma_20, sma_50, voted=None):
+    """Signal dict as rendered by MainScreen.display_signal
+
+    voted is a precomputed (signal, strength, recommendation), e.g. from a
+    RuleSet; by default the built-in vote() decides.
+    """
+    signal, strength, recommendation = voted or vote(rsi, sma_20, sma_50)
+    return {
+        'symbol': symbol,
+        'price': price,
+        'signal': signal,
+        'strength': strength,
+        'rsi': rsi,
+        'sma_20': sma_20,
+        'sma_50': sma_50,
+        'recommendation': recommendation,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def mark_stale(signal, candle_time):
+    """Flag a signal computed from candles kept while the exchange was unreachable
+
+    candle_time is the newest candle's open time in epoch milliseconds.
+    """
+    signal['stale'] = True
+    signal['candle_time'] = datetime.fromtimestamp(candle_time / 1000).strftime('%Y-%m-%d %H:%M:%S')
+    return signal
+
+
+def confluence_signal(symbol, frames):
+    """Combine per-timeframe signals, finest first, into one signal dict
+
+    BUY or SELL only when every timeframe gives that signal; strength is
+    the number of timeframes agreeing. Price and indicators are the
+    finest timeframe's, and `timeframes` maps each interval to its signal.
+    """
+    signals = [signal['signal'] for signal in frames.values()]
+    base = next(iter(frames.values()))
+    names = ' and '.join(frames)
+    if signals[0] in ('BUY', 'SELL') and signals.count(signals[0]) == len(signals):
+        signal, recommendation = signals[0], f"{names} agree - strong {signals[0]} signal"
+    elif 'BUY' in signals and 'SELL' in signals:
+        signal, recommendation = 'HOLD', "Timeframes disagree - HOLD position"
+    else:
+        signal, recommendation = 'HOLD', "No clear signal across timeframes - HOLD position"
+    return dict(
+        base,
+        symbol=symbol,
+        signal=signal,
+        strength=signals.count(signal) if signal != 'HOLD' else 0,
+        recommendation=recommendation,
+        timeframes={interval: frame['signal'] for interval, frame in frames.items()}
+    )
+
+
+def error_signal(symbol, recommendation='Unable to fetch data'):
+    """Signal dict shown when no candles are available"""
+    return {
+        'symbol': symbol,
+        'price': 0,
+        'signal': 'ERROR',
+        'strength': 0,
+        'rsi': 0,
+        'sma_20': 0,
+        'sma_50': 0,
+        'recommendation': recommendation
+    }
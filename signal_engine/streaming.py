@@ -0,0 +1,204 @@
+"""
+Streaming indicators
+Constant-time RSI / SMA updates for live candle feeds
+
+Each indicator takes one close per update(). revise() replaces the close
+passed to the last update(), for the still-open candle whose price keeps
+moving until it closes.
+"""
+
+from collections import deque
+
+from . import strategy
+
+
+class RollingSMA:
+    """Simple moving average over the last `period` closes"""
+
+    def __init__(self, period):
+        self.period = period
+        self._window = deque(maxlen=period)
+        self._sum = 0.0
+        self._updates = 0
+
+    @property
+    def ready(self):
+        return len(self._window) == self.period
+
+    @property
+    def value(self):
+        """Current average, or 0 until the window is full (as calculate_sma)"""
+        if not self.ready:
+            return 0
+        return self._sum / self.period
+
+    def update(self, close):
+        if len(self._window) == self.period:
+            self._sum -= self._window[0]
+        self._window.append(close)
+        self._sum += close
+
+        # Re-add the window now and then so float drift cannot build up
+        self._updates += 1
+        if self._updates >= self.period:
+            self._sum = sum(self._window)
+            self._updates = 0
+
+    def revise(self, close):
+        if not self._window:
+            self.update(close)
+            return
+        self._sum += close - self._window[-1]
+        self._window[-1] = close
+
+
+class _RSIBase:
+    """Shared previous/last close bookkeeping for the RSI variants"""
+
+    def __init__(self, period=14):
+        self.period = period
+        self._prev = None
+        self._last = None
+
+    def update(self, close):
+        if self._last is not None:
+            self._push(close - self._last)
+        self._prev, self._last = self._last, close
+
+    def revise(self, close):
+        if self._prev is None:
+            self._last = close
+            return
+        self._replace(close - self._prev)
+        self._last = close
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+class RollingRSI(_RSIBase):
+    """RSI from plain averages of the last `period` deltas, as calculate_rsi"""
+
+    def __init__(self, period=14):
+        super().__init__(period)
+        self._gains = deque(maxlen=period)
+        self._losses = deque(maxlen=period)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._updates = 0
+
+    @property
+    def ready(self):
+        return len(self._gains) == self.period
+
+    @property
+    def value(self):
+        """Current RSI, or 50.0 until `period` deltas are seen"""
+        if not self.ready:
+            return 50.0
+        return self._rsi(self._gain_sum / self.period, self._loss_sum / self.period)
+
+    def _push(self, delta):
+        if len(self._gains) == self.period:
+            self._gain_sum -= self._gains[0]
+            self._loss_sum -= self._losses[0]
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self._gains.append(gain)
+        self._losses.append(loss)
+        self._gain_sum += gain
+        self._loss_sum += loss
+
+        self._updates += 1
+        if self._updates >= self.period:
+            self._gain_sum = sum(self._gains)
+            self._loss_sum = sum(self._losses)
+            self._updates = 0
+
+    def _replace(self, delta):
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self._gain_sum += gain - self._gains[-1]
+        self._loss_sum += loss - self._losses[-1]
+        self._gains[-1] = gain
+        self._losses[-1] = loss
+
+
+class WilderRSI(_RSIBase):
+    """RSI with Wilder smoothing, matching indicators.rsi(..., wilder=True)"""
+
+    def __init__(self, period=14):
+        super().__init__(period)
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._saved = None
+
+    @property
+    def ready(self):
+        return self._count >= self.period
+
+    @property
+    def value(self):
+        """Current RSI, or 50.0 until `period` deltas are seen"""
+        if not self.ready:
+            return 50.0
+        return self._rsi(self._avg_gain, self._avg_loss)
+
+    def _push(self, delta):
+        self._saved = (self._count, self._avg_gain, self._avg_loss)
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self._count += 1
+        if self._count <= self.period:
+            # Seed with plain averages of the first `period` deltas
+            self._avg_gain += gain / self.period
+            self._avg_loss += loss / self.period
+        else:
+            self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+
+    def _replace(self, delta):
+        self._count, self._avg_gain, self._avg_loss = self._saved
+        self._push(delta)
+
+
+class StreamingSignal:
+    """Live signal kept current one candle update at a time
+
+    Produces the same dict as TradingSignal.generate_signal.
+    """
+
+    def __init__(self, symbol, rsi_period=14, wilder=False):
+        self.symbol = symbol
+        self.rsi = WilderRSI(rsi_period) if wilder else RollingRSI(rsi_period)
+        self.sma_20 = RollingSMA(20)
+        self.sma_50 = RollingSMA(50)
+        self.price = None
+        self.last_timestamp = None
+
+    def seed(self, prices):
+        """Feed a CandleSeries of history"""
+        for timestamp, close in zip(prices.timestamp.tolist(), prices.close.tolist()):
+            self.on_candle(timestamp, close)
+
+    def on_candle(self, timestamp, close):
+        """Apply a candle close; a repeated open time revises the open candle"""
+        if timestamp == self.last_timestamp:
+            self.rsi.revise(close)
+            self.sma_20.revise(close)
+            self.sma_50.revise(close)
+        else:
+            self.rsi.update(close)
+            self.sma_20.update(close)
+            self.sma_50.update(close)
+            self.last_timestamp = timestamp
+        self.price = close
+
+    def signal(self):
+        """Current signal dict"""
+        if self.price is None:
+            return strategy.error_signal(self.symbol)
+        return strategy.build_signal(
+            self.symbol, self.price, self.rsi.value, self.sma_20.value, self.sma_50.value
+        )
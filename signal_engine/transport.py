@@ -0,0 +1,399 @@
+"""
+Shared HTTP transport
+Pooled keep-alive session reused by every TradingSignal
+
+requests, aiohttp and asyncio are imported when a transport is first
+used, so importing this module stays cheap.
+"""
+
+import importlib.util
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# Request weight per endpoint path; anything else costs DEFAULT_WEIGHT
+ENDPOINT_WEIGHTS = {
+    '/api/v3/klines': 2,
+    '/api/v3/exchangeInfo': 20,
+    '/api/v3/ticker/price': 2
+}
+DEFAULT_WEIGHT = 1
+
+# Back-off used when a 429/418 arrives without a Retry-After header
+DEFAULT_RETRY_AFTER = {429: 60, 418: 120}
+
+
+def _counting_pool(base, on_new_connection):
+    """Subclass a urllib3 pool so every fresh connection is reported"""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            on_new_connection()
+            return super()._new_conn()
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+def _counting_adapter(on_new_connection, **kwargs):
+    """HTTPAdapter whose pools report new connections"""
+    from requests.adapters import HTTPAdapter
+
+    class CountingAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                scheme: _counting_pool(cls, on_new_connection)
+                for scheme, cls in self.poolmanager.pool_classes_by_scheme.items()
+            }
+
+    return CountingAdapter(**kwargs)
+
+
+class RateBudget:
+    """Token bucket allowing `rate` requests per second with bursts up to `burst`"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost=1):
+        """Spend `cost` tokens now and return the seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= cost
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, cost=1):
+        """Block until `cost` tokens are available"""
+        wait = self.reserve(cost)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self, cost=1):
+        """Wait without blocking the event loop until `cost` tokens are available"""
+        import asyncio
+
+        wait = self.reserve(cost)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class RateLimited(Exception):
+    """The exchange answered 429 (too many requests) or 418 (IP banned)"""
+
+    def __init__(self, status, retry_after):
+        super().__init__(f"HTTP {status}: rate limited for {retry_after:.0f}s")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def request_weight(url):
+    """Exchange weight of a GET to url"""
+    return ENDPOINT_WEIGHTS.get(urlsplit(url).path, DEFAULT_WEIGHT)
+
+
+class WeightGovernor:
+    """Process-wide request-weight budget fed by the exchange's own counters
+
+    The exchange counts weight per IP in fixed one-minute windows and
+    reports the running total in X-MBX-USED-WEIGHT-1M. Requests reserve
+    their weight up front; once the window would pass `target` of `limit`
+    they queue until the window rolls over. A 429/418 blocks everything
+    for exactly the Retry-After the exchange asked for.
+    """
+
+    def __init__(self, limit=6000, window=60, target=0.9, clock=time.time):
+        self.limit = limit
+        self.window = window
+        self.target = target
+        self.clock = clock
+        self._used = 0
+        self._window_end = 0.0
+        self._blocked_until = 0.0
+        self._throttled = 0
+        self._rate_limited = 0
+        self._lock = threading.Lock()
+
+    def _roll(self, now):
+        if now >= self._window_end:
+            self._used = 0
+            self._window_end = (now // self.window + 1) * self.window
+
+    def reserve(self, weight=1):
+        """Claim weight and return 0, or return the seconds to wait before trying again"""
+        with self._lock:
+            now = self.clock()
+            if now < self._blocked_until:
+                self._throttled += 1
+                return self._blocked_until - now
+            self._roll(now)
+            if self._used and self._used + weight > self.limit * self.target:
+                self._throttled += 1
+                return self._window_end - now
+            self._used += weight
+            return 0.0
+
+    def acquire(self, weight=1):
+        """Block until weight fits in the budget"""
+        while True:
+            wait = self.reserve(weight)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, weight=1):
+        """Wait without blocking the event loop until weight fits in the budget"""
+        import asyncio
+
+        while True:
+            wait = self.reserve(weight)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def observe(self, status, headers):
+        """Update the budget from a response; raises RateLimited on 429/418"""
+        used = headers.get('X-MBX-USED-WEIGHT-1M') or headers.get('X-MBX-USED-WEIGHT')
+        with self._lock:
+            now = self.clock()
+            self._roll(now)
+            if used is not None:
+                try:
+                    self._used = max(self._used, int(used))
+                except ValueError:
+                    pass
+            if status not in DEFAULT_RETRY_AFTER:
+                return
+            try:
+                retry_after = float(headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                retry_after = DEFAULT_RETRY_AFTER[status]
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            self._rate_limited += 1
+        raise RateLimited(status, retry_after)
+
+    def utilization(self):
+        """Share of the current window's weight limit already used, 0.0 to 1.0+"""
+        with self._lock:
+            self._roll(self.clock())
+            return self._used / self.limit
+
+    def stats(self):
+        """Budget metrics"""
+        with self._lock:
+            now = self.clock()
+            self._roll(now)
+            return {
+                'weight_used': self._used,
+                'weight_limit': self.limit,
+                'utilization': self._used / self.limit,
+                'blocked_for': max(0.0, self._blocked_until - now),
+                'throttled': self._throttled,
+                'rate_limited': self._rate_limited
+            }
+
+
+class HttpTransport:
+    """Pooled keep-alive HTTP session with connection reuse counters
+
+    pool_size is the number of hosts kept in the pool cache,
+    max_per_host caps the open connections to any single host and
+    keepalive_timeout drops idle connections before the server does.
+    Every request goes through the shared WeightGovernor unless another
+    governor is passed.
+    """
+
+    def __init__(self, pool_size=4, max_per_host=16, keepalive_timeout=60.0, timeout=10, governor=None):
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.governor = governor or get_governor()
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+        self._last_used = None
+
+        import requests
+
+        self._adapter = _counting_adapter(
+            self._record_new_connection,
+            pool_connections=pool_size,
+            pool_maxsize=max_per_host,
+            pool_block=True
+        )
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+
+    def _record_new_connection(self):
+        with self._lock:
+            self._new_connections += 1
+
+    def _expire_idle(self):
+        """Close pooled connections that sat idle past the keep-alive timeout"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._last_used is not None and now - self._last_used > self.keepalive_timeout
+            self._last_used = now
+            self._requests += 1
+        if idle:
+            self._adapter.poolmanager.clear()
+
+    def get(self, url, params=None, timeout=None, weight=None, **kwargs):
+        """Issue a GET over the pooled session once its weight fits the budget"""
+        self.governor.acquire(request_weight(url) if weight is None else weight)
+        self._expire_idle()
+        response = self.session.get(
+            url,
+            params=params,
+            timeout=self.timeout if timeout is None else timeout,
+            **kwargs
+        )
+        self.governor.observe(response.status_code, response.headers)
+        return response
+
+    def stats(self):
+        """Connection reuse counters"""
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'new_connections': self._new_connections,
+                'reused_connections': max(self._requests - self._new_connections, 0),
+                'weight_utilization': self.governor.utilization()
+            }
+
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor():
+    """Return the weight governor shared by every transport in the process"""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = WeightGovernor()
+        return _governor
+
+
+def get_transport():
+    """Return the process-wide transport, creating it on first use"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def configure_transport(**options):
+    """Replace the process-wide transport with one built from options"""
+    global _transport
+    with _transport_lock:
+        old, _transport = _transport, HttpTransport(**options)
+    if old is not None:
+        old.close()
+    return _transport
+
+
+def async_transport_available():
+    """Whether the optional aiohttp dependency is installed"""
+    return importlib.util.find_spec('aiohttp') is not None
+
+
+def async_event_loop():
+    """Running asyncio loop the async transport can fetch on, or None"""
+    if not async_transport_available():
+        return None
+    import asyncio
+
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncHttpTransport:
+    """aiohttp session pool for event-loop based fetching
+
+    Takes the same pool and governor options as HttpTransport. The session
+    is created on first use inside the running loop.
+    """
+
+    def __init__(self, pool_size=100, max_per_host=16, keepalive_timeout=60.0, timeout=10, governor=None):
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.governor = governor or get_governor()
+        self._session = None
+        self._requests = 0
+
+    def _ensure_session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.max_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def get_bytes(self, url, params=None, weight=None):
+        """GET url and return the raw body"""
+        await self.governor.acquire_async(request_weight(url) if weight is None else weight)
+        session = self._ensure_session()
+        self._requests += 1
+        params = {key: str(value) for key, value in (params or {}).items()}
+        async with session.get(url, params=params) as response:
+            self.governor.observe(response.status, response.headers)
+            response.raise_for_status()
+            return await response.read()
+
+    async def get_json(self, url, params=None):
+        """GET url and decode the JSON body"""
+        from .klines_decode import json_loads
+
+        return json_loads(await self.get_bytes(url, params=params))
+
+    def stats(self):
+        """Request counter"""
+        return {'requests': self._requests, 'weight_utilization': self.governor.utilization()}
+
+    async def close(self):
+        """Close the session and its pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_async_transport = None
+
+
+def get_async_transport():
+    """Return the process-wide async transport, creating it on first use"""
+    global _async_transport
+    with _transport_lock:
+        if _async_transport is None:
+            _async_transport = AsyncHttpTransport()
+        return _async_transport
@@ -0,0 +1,87 @@
+"""
+Walk-forward validation
+Optimize on one window, test on the next, slide forward, aggregate
+
+Indicator series are computed once per dataset through an IndicatorCache
+and sliced for every fold, so adding folds or candidates only adds the
+cheap vote and backtest passes.
+"""
+
+import numpy as np
+
+from . import backtest, indicators, strategy
+from .optimizer import grid, summary
+
+
+def plan_folds(length, train_size, test_size, step=None):
+    """(train_start, train_end, test_end) bar ranges for each fold"""
+    step = step or test_size
+    return [
+        (start, start + train_size, start + train_size + test_size)
+        for start in range(0, length - train_size - test_size + 1, step)
+    ]
+
+
+def _votes(cache, key, params, start, end):
+    return strategy.vote_series(
+        cache.rsi(key, params['rsi_period'])[start:end],
+        cache.sma(key, params['sma_fast'])[start:end],
+        cache.sma(key, params['sma_slow'])[start:end],
+        params['oversold'],
+        params['overbought']
+    )
+
+
+def _aggregate(folds):
+    """Out-of-sample metrics over every test window"""
+    if not folds:
+        return {'total_return': 0.0, 'mean_return': 0.0, 'max_drawdown': 0.0, 'win_rate': 0.0, 'trade_count': 0}
+    returns = np.array([fold['test']['total_return'] for fold in folds])
+    trades = np.array([fold['test']['trade_count'] for fold in folds])
+    win_rates = np.array([fold['test']['win_rate'] for fold in folds])
+    return {
+        'total_return': float(np.prod(1 + returns) - 1),
+        'mean_return': float(returns.mean()),
+        'max_drawdown': float(min(fold['test']['max_drawdown'] for fold in folds)),
+        'win_rate': float((win_rates * trades).sum() / trades.sum()) if trades.sum() else 0.0,
+        'trade_count': int(trades.sum())
+    }
+
+
+def walk_forward(datasets, train_size, test_size, step=None, candidates=None,
+                 metric='total_return', fee=0.001, cache=None):
+    """Walk-forward the parameter search over each dataset
+
+    datasets maps a key such as (symbol, interval) to a CandleSeries or
+    array of closes. For every fold the candidate with the best in-sample
+    metric is evaluated on the following test_size bars. Returns
+    {key: {'folds': [...], 'out_of_sample': {...}}}.
+    """
+    candidates = grid() if candidates is None else candidates
+    cache = cache or indicators.IndicatorCache()
+    for key, prices in datasets.items():
+        if key not in cache.keys():
+            cache.add(key, prices)
+
+    report = {}
+    for key in datasets:
+        closes = cache.closes(key)
+        folds = []
+        for train_start, train_end, test_end in plan_folds(len(closes), train_size, test_size, step):
+            best_params, best_train = None, None
+            for params in candidates:
+                votes = _votes(cache, key, params, train_start, train_end)
+                train = summary(backtest.backtest_votes(closes[train_start:train_end], votes, fee=fee))
+                if best_train is None or train[metric] > best_train[metric]:
+                    best_params, best_train = params, train
+
+            votes = _votes(cache, key, best_params, train_end, test_end)
+            folds.append({
+                'train_range': (train_start, train_end),
+                'test_range': (train_end, test_end),
+                'params': best_params,
+                'train': best_train,
+                'test': summary(backtest.backtest_votes(closes[train_end:test_end], votes, fee=fee))
+            })
+        report[key] = {'folds': folds, 'out_of_sample': _aggregate(folds)}
+    return report
@@ -0,0 +1,53 @@
+"""
+Background workers
+Small fixed thread pool that coalesces identical in-flight requests
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CoalescingExecutor:
+    """Thread pool where submissions with the same key share one future
+
+    A key that is still queued or running is not submitted again; callers
+    get the existing future instead. cancel_pending() drops queued work
+    that has been superseded.
+    """
+
+    def __init__(self, max_workers=2):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='signal-worker')
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, **kwargs):
+        """Run fn unless a call for key is already in flight; return its future"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None and not future.done():
+                return future
+            future = self._pool.submit(fn, *args, **kwargs)
+            self._inflight[key] = future
+        future.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def cancel_pending(self, keep=None):
+        """Cancel queued calls for every key except `keep`; running calls finish"""
+        with self._lock:
+            futures = [future for key, future in self._inflight.items() if key != keep]
+        for future in futures:
+            future.cancel()
+
+    def in_flight(self):
+        """Keys currently queued or running"""
+        with self._lock:
+            return list(self._inflight)
+
+    def shutdown(self):
+        """Cancel queued work and stop the worker threads"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
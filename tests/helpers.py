@@ -0,0 +1,74 @@
+"""
+Shared test fixtures
+Candle factories and fake klines transports
+"""
+
+import time
+
+import numpy as np
+
+from signal_engine.candles import INTERVAL_MS, CandleSeries
+
+
+def candles(first, count, interval='1h', close=None):
+    """`count` consecutive candles opening at `first`, every price column set to close
+
+    close is a number or one value per candle; by default prices climb
+    from 100 to 200.
+    """
+    timestamps = first + np.arange(count, dtype=np.int64) * INTERVAL_MS[interval]
+    if close is None:
+        close = np.linspace(100.0, 200.0, count)
+    closes = np.broadcast_to(np.asarray(close, dtype=np.float64), (count,)).copy()
+    return CandleSeries(timestamps, closes, closes, closes, closes, closes)
+
+
+def local_time(timestamp):
+    """Epoch milliseconds as the local '%Y-%m-%d %H:%M:%S' signal dicts use"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp / 1000))
+
+
+def klines_body(prices):
+    """Klines response body in Binance's 12-field layout"""
+    return ('[' + ','.join(
+        f'[{t},"{o}","{h}","{l}","{c}","{v}",{t + 1},"0",1,"0","0","0"]'
+        for t, o, h, l, c, v in prices.rows()
+    ) + ']').encode()
+
+
+class Response:
+    status_code = 200
+
+    def __init__(self, prices):
+        self.content = klines_body(prices)
+
+
+class Exchange:
+    """Sync transport answering klines requests from a full candle history
+
+    Honours startTime, endTime and limit like the exchange: with startTime
+    the oldest `limit` matching candles are returned, otherwise the newest.
+    Every request's params are kept in `requests`.
+    """
+
+    def __init__(self, history):
+        self.history = history
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append(dict(params))
+        prices = self.history
+        first, last = np.searchsorted(prices.timestamp, [
+            params.get('startTime', prices.timestamp[0]),
+            params.get('endTime', prices.timestamp[-1]) + 1
+        ])
+        prices = prices[first:last]
+        limit = params.get('limit', 500)
+        return Response(prices[:limit] if 'startTime' in params else prices[-limit:])
+
+
+class Unreachable:
+    """Sync transport whose every request fails as if offline"""
+
+    def get(self, url, params=None, **kwargs):
+        raise ConnectionError("exchange unreachable")
@@ -0,0 +1,63 @@
+"""
+Resumable backfill paging
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from signal_engine.backfill import backfill, find_gaps, plan_pages
+from signal_engine.candle_store import CandleStore
+from signal_engine.candles import INTERVAL_MS
+from signal_engine.client import AsyncTradingSignal
+
+from .helpers import Exchange, candles
+
+
+HOUR = INTERVAL_MS['1h']
+START = 1_600_000_000_000 - 1_600_000_000_000 % HOUR
+HISTORY = candles(START - 1000 * HOUR, 6000)
+
+
+class BackfillTest(unittest.TestCase):
+
+    def test_pages_sit_on_a_fixed_grid(self):
+        end = START + 5000 * HOUR
+        pages = plan_pages('1h', START, end)
+        shifted = plan_pages('1h', START + HOUR, end)
+        self.assertEqual(pages[1:], shifted[1:])
+        self.assertEqual(shifted[0][0], START + HOUR)
+        self.assertEqual(pages[-1][1], end)
+
+    def test_rerun_with_another_start_fetches_only_missing_pages(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = CandleStore(os.path.join(directory, 'candles.db'))
+            exchange = Exchange(HISTORY)
+            end = START + 3500 * HOUR - 1
+            backfill('BTCUSDT', '1h', START + 10 * HOUR, end, store=store, transport=exchange, max_workers=2)
+            first_run = len(exchange.requests)
+
+            prices = backfill('BTCUSDT', '1h', START, end, store=store, transport=exchange, max_workers=2)
+            # Only the clipped first page differs between the two runs
+            self.assertEqual(len(exchange.requests) - first_run, 1)
+            self.assertEqual(len(prices), 3500)
+            self.assertEqual(find_gaps(prices, '1h'), [])
+            self.assertTrue(np.all(prices.timestamp >= START))
+            store.close()
+
+    def test_async_client_backfills_through_a_sync_transport(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = CandleStore(os.path.join(directory, 'candles.db'))
+            trader = AsyncTradingSignal('BTCUSDT', store=store)
+            end = START + 1500 * HOUR - 1
+            prices = asyncio.run(trader.backfill('1h', START, end, transport=Exchange(HISTORY)))
+            self.assertEqual(len(prices), 1500)
+            self.assertEqual(len(store.load('BTCUSDT', '1h', 2000)), 1500)
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+CandleStore change detection
+"""
+
+import os
+import tempfile
+import unittest
+
+from signal_engine.candle_store import CandleStore
+
+from .helpers import candles
+
+
+MINUTE = 60_000
+
+
+class VersionTest(unittest.TestCase):
+
+    def test_version_tracks_every_change_to_stored_candles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = CandleStore(os.path.join(directory, 'candles.db'))
+            self.assertEqual(store.version('BTCUSDT', '1m'), (0, None, None))
+
+            store.merge('BTCUSDT', '1m', candles(10 * MINUTE, 5, '1m', close=1.0))
+            first = store.version('BTCUSDT', '1m')
+            self.assertEqual(first, (5, 14 * MINUTE, 1.0))
+
+            # Re-merging identical candles changes nothing
+            store.merge('BTCUSDT', '1m', candles(10 * MINUTE, 5, '1m', close=1.0))
+            self.assertEqual(store.version('BTCUSDT', '1m'), first)
+
+            # A revised open candle, a backfilled older one and a new one all show up
+            store.merge('BTCUSDT', '1m', candles(14 * MINUTE, 1, '1m', close=2.0))
+            self.assertEqual(store.version('BTCUSDT', '1m'), (5, 14 * MINUTE, 2.0))
+            store.merge('BTCUSDT', '1m', candles(0, 1, '1m', close=1.0))
+            self.assertEqual(store.version('BTCUSDT', '1m'), (6, 14 * MINUTE, 2.0))
+            store.merge('BTCUSDT', '1m', candles(15 * MINUTE, 1, '1m', close=3.0))
+            self.assertEqual(store.version('BTCUSDT', '1m'), (7, 15 * MINUTE, 3.0))
+
+            self.assertEqual(store.version('ETHUSDT', '1m'), (0, None, None))
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
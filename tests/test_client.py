@@ -0,0 +1,61 @@
+"""
+TradingSignal fetch paths against a stubbed transport and a temporary store
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from signal_engine.backfill import find_gaps
+from signal_engine.candle_store import CandleStore
+from signal_engine.candles import INTERVAL_MS
+from signal_engine.client import TradingSignal
+
+from .helpers import Exchange, Unreachable, candles, local_time
+
+
+HOUR = INTERVAL_MS['1h']
+
+
+class ClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = CandleStore(os.path.join(self.directory.name, 'candles.db'))
+        self.now = int(time.time() * 1000) // HOUR * HOUR
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_window_behind_a_gap_is_refetched_whole(self):
+        history = candles(self.now - 499 * HOUR, 500)
+        # An old session left 300 candles ending a week ago
+        self.store.merge('BTCUSDT', '1h', history[-468:-168])
+        exchange = Exchange(history)
+        trader = TradingSignal('BTCUSDT', transport=exchange, store=self.store)
+
+        trader.fetch_data('1h', 100)
+        prices = trader.fetch_data('1h', 208)
+        self.assertNotIn('startTime', exchange.requests[-1])
+        self.assertEqual(len(prices), 208)
+        self.assertEqual(find_gaps(prices, '1h'), [])
+
+        # Once contiguous, refreshes go back to fetching only new candles
+        trader.fetch_data('1h', 208)
+        self.assertIn('startTime', exchange.requests[-1])
+
+    def test_stale_signal_carries_candle_time(self):
+        stored = candles(self.now - 300 * HOUR, 100)
+        self.store.merge('BTCUSDT', '1h', stored)
+        trader = TradingSignal('BTCUSDT', transport=Unreachable(), store=self.store)
+
+        signal = trader.generate_signal('1h')
+        self.assertTrue(signal['stale'])
+        self.assertEqual(signal['candle_time'], local_time(stored.timestamp[-1]))
+        self.assertTrue(trader.confluence_signal('1h', ('4h',))['stale'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+SignalBoard long polls
+"""
+
+import threading
+import time
+import unittest
+
+from signal_engine.daemon import SignalBoard
+
+
+def signal(price):
+    return {'symbol': 'BTCUSDT', 'signal': 'HOLD', 'price': price, 'timestamp': None}
+
+
+class RacingBoard(SignalBoard):
+    """Publish from another thread right after a poll has read the current ETag"""
+
+    def __init__(self):
+        super().__init__()
+        self.race = None
+
+    def encoded(self, symbol=None, interval=None):
+        current = super().encoded(symbol, interval)
+        if self.race is not None:
+            publisher = threading.Thread(target=self.publish, args=('1h', self.race))
+            self.race = None
+            publisher.start()
+            publisher.join(0.1)
+        return current
+
+
+class LongPollTest(unittest.TestCase):
+
+    def test_returns_at_once_when_etag_differs(self):
+        board = SignalBoard()
+        board.publish('1h', signal(1.0))
+        etag, body = board.encoded()
+        self.assertEqual(board.wait_for_change(None, None, '"other"', 2.0), (etag, body))
+
+    def test_times_out_without_change(self):
+        board = SignalBoard()
+        etag, _ = board.encoded()
+        started = time.monotonic()
+        self.assertEqual(board.wait_for_change(None, None, etag, 0.1)[0], etag)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_publish_between_check_and_wait_is_not_missed(self):
+        board = RacingBoard()
+        board.publish('1h', signal(1.0))
+        etag, _ = board.encoded()
+        board.race = signal(2.0)
+
+        started = time.monotonic()
+        current = board.wait_for_change(None, None, etag, 2.0)
+        self.assertNotEqual(current[0], etag)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Vectorized and streaming indicators against per-bar reference loops
+
+The references are the loop formulas TradingSignal used before the
+indicators were vectorized.
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from signal_engine import indicators
+from signal_engine.streaming import RollingRSI, RollingSMA, WilderRSI
+
+
+TOLERANCE = 1e-9
+
+
+def reference_sma(closes, period):
+    """The original calculate_sma over the newest `period` closes"""
+    if len(closes) < period:
+        return 0
+    return sum(closes[-period:]) / period
+
+
+def reference_rsi(closes, period=14):
+    """The original calculate_rsi: plain averages of the last `period` deltas"""
+    if len(closes) < period + 1:
+        return 50.0
+    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    gains = [d if d > 0 else 0 for d in deltas[-period:]]
+    losses = [-d if d < 0 else 0 for d in deltas[-period:]]
+    avg_gain = sum(gains) / period
+    avg_loss = sum(losses) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def reference_wilder_rsi(closes, period=14):
+    """Wilder's RSI series, NaN until `period` deltas are seen"""
+    out = [math.nan] * len(closes)
+    avg_gain = avg_loss = 0.0
+    for i in range(1, len(closes)):
+        delta = closes[i] - closes[i - 1]
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if i >= period:
+            out[i] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+def reference_ema(closes, period):
+    out = [math.nan] * len(closes)
+    if len(closes) < period:
+        return out
+    value = sum(closes[:period]) / period
+    out[period - 1] = value
+    alpha = 2.0 / (period + 1)
+    for i in range(period, len(closes)):
+        value = (1 - alpha) * value + alpha * closes[i]
+        out[i] = value
+    return out
+
+
+def random_walk(count, seed=3):
+    rng = np.random.default_rng(seed)
+    return (1000 + np.cumsum(rng.normal(0, 2, count))).tolist()
+
+
+class VectorizedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.closes = random_walk(600)
+
+    def assertSeries(self, actual, expected):
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=TOLERANCE, equal_nan=True)
+
+    def test_sma_matches_calculate_sma(self):
+        for period in (1, 20, 50):
+            series = indicators.sma(self.closes, period)
+            self.assertTrue(np.isnan(series[:period - 1]).all())
+            expected = [reference_sma(self.closes[:i + 1], period) for i in range(period - 1, len(self.closes))]
+            self.assertSeries(series[period - 1:], expected)
+
+    def test_rsi_matches_calculate_rsi(self):
+        series = indicators.rsi(self.closes, 14)
+        self.assertTrue(np.isnan(series[:14]).all())
+        expected = [reference_rsi(self.closes[:i + 1]) for i in range(14, len(self.closes))]
+        self.assertSeries(series[14:], expected)
+
+    def test_rsi_without_losses_is_100(self):
+        rising = list(range(1, 40))
+        self.assertEqual(indicators.rsi(rising)[-1], 100.0)
+        self.assertEqual(indicators.rsi([5.0] * 20)[-1], 100.0)
+
+    def test_wilder_rsi_matches_loop(self):
+        # Long enough to span several smoothing blocks
+        closes = random_walk(12_000)
+        self.assertSeries(indicators.rsi(closes, 14, wilder=True), reference_wilder_rsi(closes, 14))
+
+    def test_ema_matches_loop(self):
+        closes = random_walk(5000)
+        for period in (5, 10, 200):
+            self.assertSeries(indicators.ema(closes, period), reference_ema(closes, period))
+
+    def test_short_inputs_are_all_nan(self):
+        self.assertTrue(np.isnan(indicators.rsi(self.closes[:14])).all())
+        self.assertTrue(np.isnan(indicators.sma(self.closes[:19], 20)).all())
+        self.assertTrue(np.isnan(indicators.ema(self.closes[:9], 10)).all())
+
+
+class StreamingTest(unittest.TestCase):
+
+    def feed(self, indicator, closes, revise=False):
+        """Values after each close; with revise every candle first updates to a provisional close"""
+        values = []
+        for close in closes:
+            if revise:
+                indicator.update(close * 1.01)
+                indicator.revise(close * 0.99)
+                indicator.revise(close)
+            else:
+                indicator.update(close)
+            values.append(indicator.value)
+        return values
+
+    def test_rolling_sma_matches_calculate_sma(self):
+        closes = random_walk(400)
+        for revise in (False, True):
+            values = self.feed(RollingSMA(20), closes, revise)
+            expected = [reference_sma(closes[:i + 1], 20) for i in range(len(closes))]
+            np.testing.assert_allclose(values, expected, rtol=0, atol=TOLERANCE)
+
+    def test_rolling_rsi_matches_calculate_rsi(self):
+        closes = random_walk(400)
+        for revise in (False, True):
+            values = self.feed(RollingRSI(14), closes, revise)
+            expected = [reference_rsi(closes[:i + 1]) for i in range(len(closes))]
+            np.testing.assert_allclose(values, expected, rtol=0, atol=TOLERANCE)
+
+    def test_wilder_rsi_matches_indicators(self):
+        closes = random_walk(400)
+        expected = np.nan_to_num(indicators.rsi(closes, 14, wilder=True), nan=50.0)
+        for revise in (False, True):
+            values = self.feed(WilderRSI(14), closes, revise)
+            np.testing.assert_allclose(values, expected, rtol=0, atol=TOLERANCE)
+
+
+if __name__ == '__main__':
+    unittest.main()
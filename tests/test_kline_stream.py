@@ -0,0 +1,97 @@
+"""
+KlineStream against a local server replaying recorded kline messages
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from signal_engine.candle_store import CandleStore
+from signal_engine.kline_stream import KlineStream, stream_available
+
+from .helpers import candles, local_time
+
+try:
+    from .ws_replay import ReplayServer, recorded
+except ImportError:
+    ReplayServer = None
+
+
+MINUTE = 60_000
+
+
+def seed_candles(before, count=100):
+    return candles(before - count * MINUTE, count, '1m', close=np.linspace(36000.0, 36900.0, count))
+
+
+@unittest.skipIf(ReplayServer is None or not stream_available(), "needs websockets and websocket-client")
+class KlineStreamReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = recorded('btcusdt_kline_1m.jsonl')
+        self.klines = [json.loads(message)['k'] for message in self.messages]
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = CandleStore(os.path.join(self.directory.name, 'candles.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_replay_disconnect_and_fallback(self):
+        seed = seed_candles(self.klines[0]['t'])
+        fetches = []
+        signals = []
+        fell_back = threading.Event()
+
+        def rest_fetch():
+            fetches.append(stream.failures)
+            # Once the exchange is unreachable REST serves the stored candles
+            return seed, stream.failures >= stream.fallback_after
+
+        def on_signal(signal):
+            signals.append(signal)
+            if signal.get('stale'):
+                fell_back.set()
+
+        # The first connection drops mid-candle; the second replays the rest
+        with ReplayServer([self.messages[:4], self.messages[4:]]) as server:
+            stream = KlineStream(
+                'BTCUSDT', '1m', on_signal=on_signal, rest_fetch=rest_fetch,
+                url=server.url, store=self.store, min_backoff=0.01, max_backoff=0.05, fallback_after=2
+            )
+            stream.start()
+            self.assertTrue(fell_back.wait(10), "REST fallback never fired")
+            stream.stop()
+
+        self.assertEqual(server.paths, ['/btcusdt@kline_1m'] * 2)
+        self.assertGreaterEqual(server.refused, 1)
+
+        # Reseeded on both connects, the second after one failure, then polled
+        # REST once fallback_after reconnects in a row had failed
+        self.assertEqual(fetches[:2], [0, 1])
+        self.assertEqual(fetches[2], 2)
+
+        # Every closed candle was merged, open ones were not
+        closed = [kline for kline in self.klines if kline['x']]
+        stored = self.store.load('BTCUSDT', '1m', 10)
+        self.assertEqual(stored.timestamp.tolist(), [kline['t'] for kline in closed])
+        self.assertEqual(stored.close.tolist(), [float(kline['c']) for kline in closed])
+        self.assertEqual(stored.volume.tolist(), [float(kline['v']) for kline in closed])
+
+        # Each replayed tick produced a signal at its price
+        prices = [signal['price'] for signal in signals]
+        self.assertEqual([price for price in prices if price != seed.close[-1]],
+                         [float(kline['c']) for kline in self.klines])
+
+        # Live signals are fresh; the one seeded from fallback candles is flagged
+        first_stale = next(index for index, signal in enumerate(signals) if signal.get('stale'))
+        self.assertEqual(first_stale, 2 + len(self.messages))
+        self.assertEqual(signals[first_stale]['candle_time'], local_time(seed.timestamp[-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
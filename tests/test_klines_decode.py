@@ -0,0 +1,43 @@
+"""
+Klines decoding with each JSON backend
+"""
+
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from signal_engine import klines_decode
+from signal_engine.klines_decode import decode_klines
+
+
+PAYLOAD = json.dumps([
+    [1700000000000 + i * 60000, f"{100 + i:.8f}", f"{101 + i:.8f}", f"{99 + i:.8f}", f"{100.5 + i:.8f}",
+     f"{i * 0.25:.8f}", 1700000059999 + i * 60000, "1.0", 10, "0.5", "0.5", "0"]
+    for i in range(50)
+], separators=(',', ':')).encode()
+
+
+class DecodeTest(unittest.TestCase):
+
+    def check(self):
+        prices = decode_klines(PAYLOAD)
+        self.assertEqual(prices.timestamp.dtype, np.int64)
+        self.assertEqual(prices.timestamp.tolist(), [1700000000000 + i * 60000 for i in range(50)])
+        self.assertEqual(prices.close.tolist(), [100.5 + i for i in range(50)])
+        self.assertEqual(prices.volume.tolist(), [i * 0.25 for i in range(50)])
+        self.assertEqual(len(decode_klines(b'[]')), 0)
+        with self.assertRaises(ValueError):
+            decode_klines(b'{"code": -1121, "msg": "Invalid symbol."}')
+
+    def test_installed_backend(self):
+        self.check()
+
+    def test_stdlib_backend(self):
+        with mock.patch.object(klines_decode, '_orjson', json):
+            self.check()
+
+
+if __name__ == '__main__':
+    unittest.main()
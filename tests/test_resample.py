@@ -0,0 +1,137 @@
+"""
+Timeframe resampling against a per-candle reference loop
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from signal_engine.candles import INTERVAL_MS, CandleSeries
+from signal_engine.resample import base_limit, ratio, reachable, resample, resample_many
+
+
+DAY = 86_400_000
+
+
+def fine_candles(first, count, interval, seed=5):
+    """Candles with independent random open, high, low, close and volume"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    open_ = close + rng.normal(0, 0.5, count)
+    high = np.maximum(open_, close) + rng.random(count)
+    low = np.minimum(open_, close) - rng.random(count)
+    timestamps = first + np.arange(count, dtype=np.int64) * INTERVAL_MS[interval]
+    return CandleSeries(timestamps, open_, high, low, close, rng.random(count) * 10)
+
+
+def bucket_start(timestamp, target):
+    """Open time of the `target` candle holding timestamp, weeks starting on Monday UTC"""
+    if target == '1w':
+        day = datetime.fromtimestamp(timestamp / 1000, timezone.utc).date()
+        monday = datetime.combine(day - timedelta(days=day.weekday()), datetime.min.time(), timezone.utc)
+        return int(monday.timestamp() * 1000)
+    return timestamp - timestamp % INTERVAL_MS[target]
+
+
+def reference_resample(prices, target):
+    buckets = {}
+    for timestamp, open_, high, low, close, volume in prices.rows():
+        start = bucket_start(timestamp, target)
+        if start not in buckets:
+            buckets[start] = [start, open_, high, low, close, volume, timestamp]
+        else:
+            bucket = buckets[start]
+            bucket[2] = max(bucket[2], high)
+            bucket[3] = min(bucket[3], low)
+            bucket[4] = close
+            bucket[5] += volume
+    rows = list(buckets.values())
+    # The download started inside the oldest bucket, so it is incomplete
+    if rows and rows[0][6] != rows[0][0]:
+        rows = rows[1:]
+    return CandleSeries.from_rows([tuple(row[:6]) for row in rows])
+
+
+class ResampleTest(unittest.TestCase):
+
+    def assertCandles(self, actual, expected):
+        self.assertEqual(actual.timestamp.tolist(), expected.timestamp.tolist())
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            np.testing.assert_allclose(getattr(actual, column), getattr(expected, column), rtol=1e-12)
+
+    def test_matches_reference_loop(self):
+        # 2023-11-14 22:13 UTC, inside every coarser bucket
+        first = 1_700_000_000_000 - 1_700_000_000_000 % 60_000
+        cases = [('1m', '5m', 997), ('1m', '1h', 1000), ('15m', '4h', 900),
+                 ('1h', '4h', 1000), ('1h', '1d', 1000), ('1h', '1w', 1000), ('1d', '1w', 400),
+                 ('4h', '1w', 700), ('1d', '3d', 300)]
+        for interval, target, count in cases:
+            with self.subTest(interval=interval, target=target):
+                start = first - first % INTERVAL_MS[interval]
+                prices = fine_candles(start, count, interval)
+                resampled = resample(prices, interval, target)
+                self.assertCandles(resampled, reference_resample(prices, target))
+                self.assertGreater(len(resampled), 1)
+
+    def test_drops_partial_oldest_bucket_only(self):
+        hour = INTERVAL_MS['1h']
+        aligned = fine_candles(100 * 4 * hour, 40, '1h')
+        self.assertEqual(len(resample(aligned, '1h', '4h')), 10)
+
+        partial = aligned[1:]
+        resampled = resample(partial, '1h', '4h')
+        self.assertEqual(len(resampled), 9)
+        self.assertEqual(int(resampled.timestamp[0]), int(aligned.timestamp[4]))
+
+        # The newest bucket is kept even though it is still open
+        self.assertEqual(len(resample(aligned[:38], '1h', '4h')), 10)
+        self.assertEqual(len(resample(partial[:2], '1h', '4h')), 0)
+        self.assertEqual(len(resample(CandleSeries.empty(), '1h', '4h')), 0)
+
+    def test_weeks_open_on_monday(self):
+        # 2024-01-01 was a Monday
+        monday = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+        prices = fine_candles(monday - 3 * DAY, 24, '1d')
+        weeks = resample(prices, '1d', '1w')
+        self.assertEqual(weeks.timestamp.tolist(), [monday + i * 7 * DAY for i in range(3)])
+        for timestamp in weeks.timestamp.tolist():
+            self.assertEqual(datetime.fromtimestamp(timestamp / 1000, timezone.utc).weekday(), 0)
+
+    def test_ratio(self):
+        self.assertEqual(ratio('1h', '4h'), 4)
+        self.assertEqual(ratio('1d', '1w'), 7)
+        self.assertEqual(ratio('4h', '1w'), 42)
+        self.assertIsNone(ratio('4h', '1h'))
+        self.assertIsNone(ratio('1h', '1h'))
+        self.assertIsNone(ratio('2h', '3h'))
+        self.assertIsNone(ratio('1h', '1M'))
+        self.assertIsNone(ratio('3d', '1w'))
+        with self.assertRaises(ValueError):
+            resample(fine_candles(0, 10, '3d'), '3d', '1w')
+
+    def test_reachable_and_base_limit(self):
+        # One page holds 1000 candles: 52 buckets (51 + a dropped partial one) of up to 19
+        expected = {
+            '1m': (['5m', '15m'], 780),
+            '5m': (['15m', '1h'], 624),
+            '15m': (['1h', '2h', '4h'], 832),
+            '1h': (['2h', '4h', '8h', '12h'], 624),
+            '4h': (['8h', '12h', '1d', '3d'], 936),
+            '1d': (['3d', '1w'], 364),
+            '1w': ([], 51)
+        }
+        candidates = ['5m', '15m', '1h', '2h', '4h', '8h', '12h', '1d', '3d', '1w']
+        for interval, (targets, limit) in expected.items():
+            with self.subTest(interval=interval):
+                found = reachable(interval, candidates)
+                self.assertEqual(found, targets)
+                self.assertEqual(base_limit(interval, found), limit)
+                for target in found:
+                    self.assertGreaterEqual(limit // ratio(interval, target) - 1, 51)
+        self.assertEqual(base_limit('1h', ['1d']), 1000)
+        self.assertEqual(set(resample_many(fine_candles(0, 100, '1h'), '1h', ['1h', '4h'])), {'1h', '4h'})
+
+
+if __name__ == '__main__':
+    unittest.main()
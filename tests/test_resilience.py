@@ -0,0 +1,107 @@
+"""
+Circuit breaker probes in ResilientTransport
+"""
+
+import asyncio
+import unittest
+
+from signal_engine.resilience import CircuitOpen, ResilientTransport
+from signal_engine.transport import RateLimited
+
+
+URL = "https://api.binance.com/api/v3/klines"
+
+
+class Response:
+    status_code = 200
+    content = b"[]"
+
+
+class ScriptedTransport:
+    """Raise or return the scripted outcomes in order, sync and async"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+
+    def _next(self):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def get(self, url, params=None, **kwargs):
+        return self._next()
+
+    async def get_bytes(self, url, params=None, **kwargs):
+        outcome = self._next()
+        if outcome == 'hang':
+            await asyncio.sleep(60)
+        return outcome
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitProbeTest(unittest.TestCase):
+
+    def open_circuit(self, outcomes):
+        """A transport whose breaker was opened by two connection errors and is due a probe"""
+        transport = ResilientTransport(
+            ScriptedTransport(ConnectionError(), ConnectionError(), *outcomes),
+            retries=0, hedge=False, breaker_threshold=2, breaker_reset=30.0
+        )
+        clock = Clock()
+        breaker = transport.breaker(URL)
+        breaker.clock = clock
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                transport.get(URL)
+        self.assertEqual(breaker.state, 'open')
+        clock.now += 31
+        return transport, breaker
+
+    def test_transient_probe_failure_reopens(self):
+        transport, breaker = self.open_circuit([ConnectionError()])
+        with self.assertRaises(ConnectionError):
+            transport.get(URL)
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(CircuitOpen):
+            transport.get(URL)
+
+    def test_rate_limited_probe_closes(self):
+        transport, breaker = self.open_circuit([RateLimited(429, 60), Response()])
+        with self.assertRaises(RateLimited):
+            transport.get(URL)
+        self.assertEqual(breaker.state, 'closed')
+        self.assertIsInstance(transport.get(URL), Response)
+
+    def test_interrupted_probe_is_released(self):
+        transport, breaker = self.open_circuit([KeyboardInterrupt(), Response()])
+        with self.assertRaises(KeyboardInterrupt):
+            transport.get(URL)
+        self.assertEqual(breaker.state, 'half_open')
+        self.assertIsInstance(transport.get(URL), Response)
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_cancelled_async_probe_is_released(self):
+        transport, breaker = self.open_circuit(['hang', b'[]'])
+
+        async def cancel_probe():
+            task = asyncio.ensure_future(transport.get_bytes(URL))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return await transport.get_bytes(URL)
+
+        self.assertEqual(asyncio.run(cancel_probe()), b'[]')
+        self.assertEqual(breaker.state, 'closed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Declarative rule sets against the built-in voting rules
+"""
+
+import unittest
+
+import numpy as np
+
+from signal_engine import strategy
+from signal_engine.backtest import strategy_votes
+from signal_engine.client import TradingSignal
+from signal_engine.rules import RuleSet, default_rules, parse_condition
+
+from .helpers import candles
+
+
+def random_walk(count, seed=7):
+    """Closes that trend and chop enough to hit both RSI extremes"""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 1, count) + 0.6 * np.sin(np.arange(count) / 40)
+    return 1000 + np.cumsum(steps)
+
+
+def crossing(condition):
+    return RuleSet([{'when': condition, 'vote': 'buy'}], buy_threshold=1)
+
+
+class DefaultRulesTest(unittest.TestCase):
+
+    def test_evaluate_matches_strategy_votes(self):
+        closes = random_walk(20_000)
+        votes = default_rules().evaluate(closes)['votes']
+        expected = strategy_votes(closes)
+        self.assertEqual(np.count_nonzero(votes != expected), 0)
+        self.assertTrue((expected == 1).any() and (expected == -1).any())
+
+    def test_latest_matches_vote(self):
+        prices = candles(0, 3000, close=random_walk(3000, seed=11))
+        builtin = TradingSignal('BTCUSDT')
+        ruled = TradingSignal('BTCUSDT', rules=default_rules())
+        seen = set()
+        for end in range(40, len(prices), 7):
+            window = prices[end - 100 if end > 100 else 0:end]
+            rsi = builtin.calculate_rsi(window)
+            expected = strategy.vote(rsi, builtin.calculate_sma(window, 20), builtin.calculate_sma(window, 50))
+            self.assertEqual(default_rules().latest(window), expected)
+
+            signal, rule_signal = builtin.signal_from_prices(window), ruled.signal_from_prices(window)
+            self.assertEqual(dict(signal, timestamp=None), dict(rule_signal, timestamp=None))
+            seen.add(expected[0])
+        self.assertEqual(seen, {'BUY', 'SELL', 'HOLD'})
+
+
+class RuleSetTest(unittest.TestCase):
+
+    def test_crosses_never_fire_on_the_first_bar(self):
+        above = crossing('close crosses_above 10')
+        self.assertEqual(above.evaluate(np.array([11.0, 12.0, 9.0, 11.0]))['votes'].tolist(), [0, 0, 0, 1])
+        below = crossing('close crosses_below 10')
+        self.assertEqual(below.evaluate(np.array([9.0, 8.0, 11.0, 9.0]))['votes'].tolist(), [0, 0, 0, 1])
+
+        self.assertEqual(above.latest(np.array([11.0]))[0], 'HOLD')
+        self.assertEqual(above.latest(np.array([5.0, 9.0, 11.0]))[0], 'BUY')
+        self.assertEqual(below.latest(np.array([12.0, 11.0, 9.0]))[0], 'BUY')
+        self.assertEqual(below.latest(np.array([9.0, 9.0]))[0], 'HOLD')
+
+    def test_weights_and_all_of_conditions(self):
+        rules = RuleSet([
+            {'when': ['close > 10', 'close < 20'], 'vote': 'buy', 'weight': 1.5},
+            {'when': 'close > 15', 'vote': 'buy', 'weight': 0.5}
+        ], buy_threshold=2)
+        result = rules.evaluate(np.array([5.0, 12.0, 16.0, 25.0]))
+        self.assertEqual(result['buy_score'].tolist(), [0.0, 1.5, 2.0, 0.5])
+        self.assertEqual(result['votes'].tolist(), [0, 0, 1, 0])
+        self.assertEqual(rules.latest(np.array([16.0])), ('BUY', 2, "Strong BUY signal detected"))
+
+    def test_rejects_malformed_rules(self):
+        for condition in ('rsi<30', 'rsi < ', 'rsi =< 30', 'rsi < thirty', 'macd > 0', 'sma_ > 1', ''):
+            with self.assertRaises(ValueError, msg=condition):
+                parse_condition(condition)
+        with self.assertRaises(ValueError):
+            RuleSet([])
+        with self.assertRaises(ValueError):
+            RuleSet([{'when': 'rsi < 30', 'vote': 'maybe'}])
+        with self.assertRaises(ValueError):
+            RuleSet([{'when': [], 'vote': 'buy'}])
+        with self.assertRaises(ValueError):
+            crossing('open > 1').evaluate(np.array([1.0, 2.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
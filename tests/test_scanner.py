@@ -0,0 +1,65 @@
+"""
+Async watchlist scanning
+"""
+
+import asyncio
+import json
+import unittest
+
+from signal_engine.scanner import SignalScanner
+
+
+class SlowExchange:
+    """Async transport whose klines never arrive for symbols listed in `hang`"""
+
+    def __init__(self, hang=()):
+        self.hang = set(hang)
+        self.inflight = 0
+
+    async def get_bytes(self, url, params=None, **kwargs):
+        if url == SignalScanner.EXCHANGE_INFO_URL:
+            return json.dumps({'symbols': [
+                {'symbol': 'BTCUSDT', 'quoteAsset': 'USDT', 'status': 'TRADING'},
+                {'symbol': 'ETHBTC', 'quoteAsset': 'BTC', 'status': 'TRADING'},
+                {'symbol': 'LUNAUSDT', 'quoteAsset': 'USDT', 'status': 'BREAK'}
+            ]}).encode()
+        self.inflight += 1
+        try:
+            if params['symbol'] in self.hang:
+                await asyncio.sleep(60)
+            return b'[[0,"1","1","1","1","1"]]'
+        finally:
+            self.inflight -= 1
+
+
+class ScanAsyncTest(unittest.TestCase):
+
+    def test_usdt_symbols_async(self):
+        scanner = SignalScanner(transport=object())
+        self.assertEqual(asyncio.run(scanner.usdt_symbols_async(SlowExchange())), ['BTCUSDT'])
+
+    def test_cancelling_a_scan_cancels_pending_fetches(self):
+        exchange = SlowExchange(hang={'ETHUSDT', 'SOLUSDT'})
+        scanner = SignalScanner(transport=object(), requests_per_second=1000)
+        received = []
+
+        async def consume():
+            async for signal in scanner.scan_async(['BTCUSDT', 'ETHUSDT', 'SOLUSDT'], transport=exchange):
+                received.append(signal['symbol'])
+
+        async def main():
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.05)
+            self.assertEqual(exchange.inflight, 2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0)
+            return exchange.inflight
+
+        self.assertEqual(asyncio.run(main()), 0)
+        self.assertEqual(received, ['BTCUSDT'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+WeightGovernor budgeting on a fake clock
+"""
+
+import unittest
+
+from signal_engine.transport import RateLimited, WeightGovernor
+
+
+class Clock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class WeightGovernorTest(unittest.TestCase):
+
+    def setUp(self):
+        # Windows are minute-aligned: this one runs from 960 to 1020
+        self.clock = Clock(1_000.0)
+        self.governor = WeightGovernor(limit=1000, window=60, target=0.9, clock=self.clock)
+
+    def test_header_corrects_local_count(self):
+        self.assertEqual(self.governor.reserve(2), 0.0)
+        self.governor.observe(200, {'X-MBX-USED-WEIGHT-1M': '850'})
+        self.assertEqual(self.governor.stats()['weight_used'], 850)
+
+        # Other clients' weight counts against us too: 850 + 60 passes the 900 target
+        self.assertEqual(self.governor.reserve(60), 20.0)
+
+        # A lower figure (from an older response) never lowers the count
+        self.governor.observe(200, {'X-MBX-USED-WEIGHT-1M': '100'})
+        self.assertEqual(self.governor.stats()['weight_used'], 850)
+
+        # Unparseable headers are ignored
+        self.governor.observe(200, {'X-MBX-USED-WEIGHT-1M': 'n/a'})
+        self.assertEqual(self.governor.utilization(), 0.85)
+
+    def test_queues_past_target_until_window_rolls(self):
+        for _ in range(45):
+            self.assertEqual(self.governor.reserve(20), 0.0)
+        self.assertEqual(self.governor.stats()['weight_used'], 900)
+
+        self.clock.now = 1_005.0
+        self.assertEqual(self.governor.reserve(1), 15.0)
+        self.assertEqual(self.governor.stats()['throttled'], 1)
+
+        self.clock.now = 1_020.0
+        self.assertEqual(self.governor.reserve(1), 0.0)
+        self.assertEqual(self.governor.stats()['weight_used'], 1)
+
+    def test_first_request_of_a_window_always_goes_out(self):
+        self.assertEqual(self.governor.reserve(5000), 0.0)
+
+    def test_429_honours_retry_after(self):
+        with self.assertRaises(RateLimited) as raised:
+            self.governor.observe(429, {'Retry-After': '7'})
+        self.assertEqual((raised.exception.status, raised.exception.retry_after), (429, 7.0))
+        self.assertEqual(self.governor.reserve(1), 7.0)
+
+        self.clock.now += 5
+        self.assertEqual(self.governor.reserve(1), 2.0)
+        self.clock.now += 2
+        self.assertEqual(self.governor.reserve(1), 0.0)
+        self.assertEqual(self.governor.stats()['rate_limited'], 1)
+
+    def test_429_without_retry_after_uses_default(self):
+        with self.assertRaises(RateLimited) as raised:
+            self.governor.observe(429, {})
+        self.assertEqual(raised.exception.retry_after, 60)
+        self.assertEqual(self.governor.stats()['blocked_for'], 60)
+
+        with self.assertRaises(RateLimited) as raised:
+            self.governor.observe(418, {'Retry-After': 'soon'})
+        self.assertEqual(raised.exception.retry_after, 120)
+        self.assertEqual(self.governor.reserve(1), 120.0)
+
+    def test_success_does_not_block(self):
+        self.governor.observe(200, {})
+        self.governor.observe(404, {'Retry-After': '30'})
+        self.assertEqual(self.governor.reserve(1), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
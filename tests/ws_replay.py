@@ -0,0 +1,62 @@
+"""
+Local WebSocket server replaying recorded exchange messages
+
+Each accepted connection plays the next session (a list of raw messages)
+and then drops the TCP connection, as when the exchange disconnects.
+Once every session has been played further handshakes are refused with
+HTTP 503, so a client sees its reconnects fail.
+"""
+
+import os
+import socket
+import threading
+
+from websockets.sync.server import serve
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+def recorded(name):
+    """Raw messages of a recording in tests/data, one per line"""
+    with open(os.path.join(DATA_DIR, name), encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+class ReplayServer:
+    """Serve `sessions` on ws://127.0.0.1:<port> from a background thread"""
+
+    def __init__(self, sessions):
+        self.sessions = [list(session) for session in sessions]
+        self.paths = []
+        self.refused = 0
+        self._lock = threading.Lock()
+        sock = socket.create_server(('127.0.0.1', 0))
+        self.url = f"ws://127.0.0.1:{sock.getsockname()[1]}"
+        self._server = serve(self._handle, sock=sock, process_request=self._admit)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._thread.join(5)
+
+    def _admit(self, connection, request):
+        with self._lock:
+            if self.sessions:
+                return None
+            self.refused += 1
+        return connection.respond(503, "replay finished\n")
+
+    def _handle(self, connection):
+        with self._lock:
+            self.paths.append(connection.request.path)
+            session = self.sessions.pop(0)
+        for message in session:
+            connection.send(message)
+        # Drop the connection without a closing handshake
+        connection.socket.shutdown(socket.SHUT_RDWR)
+        connection.close_socket()
@@ -0,0 +1,255 @@
+"""
+Watchlist screen
+Live price, signal and RSI for every USDT pair in a virtualized list
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.screenmanager import Screen
+import asyncio
+import threading
+
+from signal_engine import RefreshSchedule, SignalScanner, async_event_loop
+
+
+# Seconds before retrying a failed scan
+RETRY_DELAY = 60
+
+SIGNAL_COLORS = {
+    'BUY': (0.22, 0.93, 0.49, 1),
+    'SELL': (0.92, 0.36, 0.26, 1),
+    'HOLD': (0.7, 0.7, 0.7, 1),
+    'ERROR': (1, 0.5, 0, 1)
+}
+
+
+def format_price(price):
+    """Dollar price with enough decimals for sub-cent pairs"""
+    if price >= 1:
+        return f"${price:,.2f}"
+    return "$" + f"{price:.8f}".rstrip('0').rstrip('.')
+
+
+def fill_row(row, signal):
+    """Copy the displayed fields of a signal into a RecycleView data row"""
+    row['signal'] = signal['signal']
+    if signal['signal'] != 'ERROR':
+        row['price_text'] = format_price(signal['price'])
+        row['rsi_text'] = f"{signal['rsi']:.1f}"
+
+
+class WatchlistRow(RecycleDataViewBehavior, ButtonBehavior, BoxLayout):
+    """One recycled row; RecycleView rebinds it to whichever symbol scrolls into view"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.symbol = None
+        self.on_select = None
+        self.symbol_label = Label(bold=True, halign='left', size_hint_x=0.3)
+        self.price_label = Label(size_hint_x=0.3)
+        self.signal_label = Label(bold=True, size_hint_x=0.2)
+        self.rsi_label = Label(size_hint_x=0.2, color=(0.8, 0.8, 0.8, 1))
+        for label in (self.symbol_label, self.price_label, self.signal_label, self.rsi_label):
+            self.add_widget(label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.symbol = data['symbol']
+        self.on_select = data.get('on_select')
+        self.symbol_label.text = data['symbol']
+        self.price_label.text = data.get('price_text', '--')
+        self.signal_label.text = data.get('signal', '...')
+        self.signal_label.color = SIGNAL_COLORS.get(data.get('signal'), (0.5, 0.5, 0.5, 1))
+        self.rsi_label.text = data.get('rsi_text', '--')
+
+    def on_release(self):
+        if self.on_select is not None:
+            self.on_select(self.symbol)
+
+
+class WatchlistScreen(Screen):
+    """Scan hundreds of symbols and show them in a RecycleView"""
+
+    def __init__(self, store=None, rules=None, on_select=None, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.rules = rules
+        self.on_select = on_select
+        self.interval = '1h'
+        self._rows = {}
+        self._latest = {}
+        self._latest_interval = None
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush = Clock.create_trigger(self.flush)
+        self._stopped = None
+        self._task = None
+        self.build_ui()
+
+    def build_ui(self):
+        """Build the user interface"""
+        layout = BoxLayout(orientation='vertical', padding=10, spacing=10)
+
+        header = BoxLayout(size_hint_y=None, height=dp(48), spacing=5)
+        back_btn = Button(
+            text='← Back',
+            size_hint_x=0.3,
+            background_color=(0.4, 0.49, 0.92, 1)
+        )
+        back_btn.bind(on_press=lambda x: setattr(self.manager, 'current', 'main'))
+        header.add_widget(back_btn)
+        self.status_label = Label(text='Watchlist', font_size='16sp')
+        header.add_widget(self.status_label)
+        layout.add_widget(header)
+
+        columns = BoxLayout(size_hint_y=None, height=dp(24))
+        for title, width in (('Symbol', 0.3), ('Price', 0.3), ('Signal', 0.2), ('RSI', 0.2)):
+            columns.add_widget(Label(text=title, font_size='13sp', color=(0.7, 0.7, 0.7, 1), size_hint_x=width))
+        layout.add_widget(columns)
+
+        self.rv = RecycleView()
+        rows = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, dp(40)),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        rows.bind(minimum_height=rows.setter('height'))
+        self.rv.add_widget(rows)
+        # The view class only reaches the layout manager once it is attached
+        self.rv.viewclass = WatchlistRow
+        layout.add_widget(self.rv)
+
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.start()
+
+    def on_leave(self, *args):
+        self.stop()
+
+    def set_symbols(self, symbols):
+        """Replace the list, filling rows from signals already scanned"""
+        data = []
+        for symbol in symbols:
+            row = {'symbol': symbol, 'on_select': self.on_select}
+            if symbol in self._latest:
+                fill_row(row, self._latest[symbol])
+            data.append(row)
+        self._rows = {row['symbol']: row for row in data}
+        self.rv.data = data
+
+    def on_signal(self, signal):
+        """Queue a scanned signal; called from the scan thread"""
+        with self._pending_lock:
+            self._pending[signal['symbol']] = signal
+        self._flush()
+
+    def flush(self, *args):
+        """Apply every queued signal with a single RecycleView refresh"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        self._latest.update(pending)
+        changed = False
+        for symbol, signal in pending.items():
+            row = self._rows.get(symbol)
+            if row is not None:
+                fill_row(row, signal)
+                changed = True
+        # Rows are edited in place, so only the visible views need rebinding
+        if changed:
+            self.rv.refresh_from_data()
+
+    def start(self):
+        """Scan the watchlist in the background until stop()"""
+        self.stop()
+        if self.interval != self._latest_interval:
+            # Signals from another timeframe would be misleading
+            self._latest = {}
+            self._latest_interval = self.interval
+            self.set_symbols(list(self._rows))
+
+        # Scan on the app's event loop when running async; a thread is the fallback
+        if async_event_loop() is not None:
+            self._task = asyncio.ensure_future(self._scan_forever_async(self.interval))
+            return
+        stopped = threading.Event()
+        self._stopped = stopped
+        threading.Thread(target=self._scan_forever, args=(stopped, self.interval),
+                         name='watchlist-scan', daemon=True).start()
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._stopped is not None:
+            self._stopped.set()
+            self._stopped = None
+
+    async def _scan_forever_async(self, interval):
+        scanner = SignalScanner(interval, store=self.store, rules=self.rules)
+        schedule = RefreshSchedule()
+        symbols = None
+        due = None
+        while True:
+            try:
+                if symbols is None:
+                    symbols = await scanner.usdt_symbols_async()
+                    self.set_symbols(symbols)
+                    for symbol in symbols:
+                        schedule.watch(symbol, interval)
+                    due = symbols
+                if due:
+                    self.status_label.text = f'Scanning {interval}...'
+                    async for signal in scanner.scan_async(due):
+                        self.on_signal(signal)
+                    self.status_label.text = f'{len(symbols)} pairs · {interval}'
+            except Exception as e:
+                print(f"Watchlist scan failed: {e}")
+                self.status_label.text = 'Scan failed'
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+            await asyncio.sleep(schedule.delay())
+            due = [symbol for symbol, _ in schedule.pop_due()]
+
+    def _scan_forever(self, stopped, interval):
+        scanner = SignalScanner(interval, store=self.store, rules=self.rules)
+        schedule = RefreshSchedule()
+        symbols = None
+        due = None
+        while not stopped.is_set():
+            try:
+                if symbols is None:
+                    symbols = scanner.usdt_symbols()
+                    Clock.schedule_once(lambda dt: self.set_symbols(symbols), 0)
+                    for symbol in symbols:
+                        schedule.watch(symbol, interval)
+                    due = symbols
+                if due:
+                    self._scan(scanner, due, stopped)
+                    Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', f'{len(symbols)} pairs · {interval}'), 0)
+            except Exception as e:
+                print(f"Watchlist scan failed: {e}")
+                Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', 'Scan failed'), 0)
+                stopped.wait(RETRY_DELAY)
+                continue
+            # Every pair shares the interval, so one wake-up per candle close rescans them all
+            stopped.wait(schedule.delay())
+            due = [symbol for symbol, _ in schedule.pop_due()]
+
+    def _scan(self, scanner, symbols, stopped):
+        Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', f'Scanning {scanner.interval}...'), 0)
+        scan = scanner.scan(symbols)
+        try:
+            for signal in scan:
+                if stopped.is_set():
+                    return
+                self.on_signal(signal)
+        finally:
+            scan.close()